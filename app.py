@@ -1,25 +1,71 @@
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, render_template, request, jsonify, session, Response, stream_with_context
 from werkzeug.utils import secure_filename
 import os
+import json
+import uuid
 from datetime import timedelta
 from backend import (
-    load_pdf_text,
-    extract_resume_skills,
-    search_jobs,
+    spool_upload,
+    parse_resume,
+    persist_resume,
+    sweep_uploads,
+    http_client_stats,
+    job_search_stats,
+    generated_cache_stats,
+    warm_up_llm,
+    RESUME_CACHE,
+    SEARCH_CACHE,
+    SINGLE_FLIGHT,
+    find_jobs,
+    start_job_pagination,
+    next_jobs_page,
     generate_cover_letter,
+    stream_cover_letter,
+    generate_cover_letters,
+    COVER_LETTER_BATCH_MAX,
     analyze_skill_gap,
+    analyze_skill_gaps,
+    SKILL_GAP_BATCH_MAX,
     get_course_recommendations,
-    research_company_for_interview
+    stream_skill_gap_and_courses,
+    research_company_for_interview,
+    stream_company_research
 )
+from session_store import create_session_interface
+from tasks import create_task_manager, TaskQueueFull
+from llm_client import rate_limit_stats
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'uploads'
+app.config['PERSIST_UPLOADS'] = os.environ.get('PERSIST_UPLOADS') == '1'  # Uploads are parsed in memory unless enabled
+app.config['UPLOAD_RETENTION'] = timedelta(days=1)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['SECRET_KEY'] = 'your-secret-key-change-this-in-production-12345'  # ✅ ADDED
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=2)  # ✅ ADDED
 
+# Server-side sessions: the cookie only holds an opaque id, resume text stays on the server
+app.config['SESSION_BACKEND'] = os.environ.get('SESSION_BACKEND', 'memory')  # 'memory' or 'sqlite' (shared by workers)
+app.config['SESSION_SQLITE_PATH'] = os.environ.get('SESSION_SQLITE_PATH', 'sessions.db')
+app.config['SESSION_MAX_ENTRIES'] = 1000
+app.config['SESSION_MAX_BYTES'] = 64 * 1024 * 1024  # 64MB cap across all sessions
+app.session_interface = create_session_interface(app.config)
+
+# Background tasks: slow generation runs on a bounded worker pool instead of a request thread
+app.config['TASK_BACKEND'] = os.environ.get('TASK_BACKEND', 'memory')  # 'memory' or 'sqlite' (shared by workers)
+app.config['TASK_SQLITE_PATH'] = os.environ.get('TASK_SQLITE_PATH', 'tasks.db')
+app.config['TASK_MAX_WORKERS'] = 4
+app.config['TASK_MAX_QUEUE'] = 32  # queued + running tasks before new ones are refused
+app.config['TASK_RESULT_TTL'] = timedelta(minutes=30)
+app.config['TASK_MAX_WAIT'] = 25  # seconds a status request may long-poll
+tasks = create_task_manager(app.config)
+
+# Import the Gemini SDK and build the model handle off the request path
+if os.environ.get('LLM_WARMUP', '1') == '1':
+    warm_up_llm()
+
 # Ensure upload directory exists
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+if app.config['PERSIST_UPLOADS']:
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 @app.route('/')
 def index():
@@ -41,23 +87,32 @@ def upload_resume():
         
         if file and file.filename.endswith('.pdf'):
             filename = secure_filename(file.filename)
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
+            session_id = uuid.uuid4().hex
             
-            print(f"✓ File saved: {filename}")
+            # Buffer the upload in memory (spills to a temp file only when large)
+            pdf, resume_hash = spool_upload(file.stream)
             
-            # Extract text and skills
-            resume_text = load_pdf_text(filepath)
+            with pdf:
+                if app.config['PERSIST_UPLOADS']:
+                    filepath = persist_resume(pdf, resume_hash, app.config['UPLOAD_FOLDER'])
+                    sweep_uploads(app.config['UPLOAD_FOLDER'], app.config['UPLOAD_RETENTION'].total_seconds())
+                    print(f"✓ File saved: {filepath}")
+                    pdf.seek(0)
+                
+                # Extract text and skills (skipped when this exact PDF was parsed before)
+                parsed, cache_hit = parse_resume(pdf, resume_hash)
+            resume_text = parsed['text']
+            skills = parsed['skills']
+            print(f"✓ Resume cache {'hit' if cache_hit else 'miss'}: {parsed['hash'][:12]}")
             print(f"✓ Text extracted: {len(resume_text)} chars")
-            
-            skills = extract_resume_skills(resume_text)
             print(f"✓ Skills found: {skills}")
             
             # Store in Flask session (persistent across requests)
             session['resume_text'] = resume_text
+            session['resume_hash'] = parsed['hash']
             session['skills'] = skills
             session['filename'] = filename
-            session['session_id'] = filename
+            session['session_id'] = session_id
             session.permanent = True
             
             print(f"✓ Session created and stored")
@@ -65,9 +120,10 @@ def upload_resume():
             
             return jsonify({
                 'success': True,
-                'session_id': filename,
+                'session_id': session_id,
                 'filename': filename,
-                'skills': skills
+                'skills': skills,
+                'cache': 'hit' if cache_hit else 'miss'
             })
         
         return jsonify({'error': 'Invalid file type. Please upload a PDF.'}), 400
@@ -82,7 +138,22 @@ def upload_resume():
 def search_jobs_api():
     try:
         data = request.get_json()
-        skills = data.get('skills', [])  # This is likely a list
+        
+        # "Show more": the cursor from the previous page carries the query
+        cursor = data.get('cursor')
+        if cursor:
+            page = next_jobs_page(str(cursor), resume_text=session.get('resume_text', ''))
+            if page is None:
+                return jsonify({'success': False, 'error': 'Search results expired. Please search again.'}), 400
+            jobs, next_cursor = page
+            return jsonify({
+                'success': True,
+                'jobs': jobs,
+                'source': 'upstream',
+                'next_cursor': next_cursor
+            })
+        
+        skills = data.get('skills') or session.get('skills', [])  # Defaults to the uploaded resume's skills
         location = data.get('location', 'India')
         limit = data.get('limit', 8)
         
@@ -90,12 +161,14 @@ def search_jobs_api():
         print(f"📥 Received skills: {type(skills)} - {skills}")
         print(f"📥 Location: {location}")
         
-        # Call backend function (now handles both list and dict)
-        jobs = search_jobs(skills, location, limit)
+        # Served from the local job store when it has enough fresh matches
+        jobs, source = find_jobs(skills, location, limit, resume_text=session.get('resume_text', ''))
         
         return jsonify({
             'success': True,
-            'jobs': jobs
+            'jobs': jobs,
+            'source': source,
+            'next_cursor': start_job_pagination(skills, location, limit, jobs, source)
         })
         
     except Exception as e:
@@ -140,7 +213,9 @@ def generate_cover_letter_api():
         
         # Generate cover letter
         print("Generating cover letter...")
-        letter = generate_cover_letter(resume_text, job)
+        letter = generate_cover_letter(
+            resume_text, job, resume_hash=session.get('resume_hash'), regenerate=bool(data.get('regenerate'))
+        )
         
         print(f"✓ Cover letter generated ({len(letter)} chars)")
         print("="*60 + "\n")
@@ -156,6 +231,100 @@ def generate_cover_letter_api():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+def sse_event(event, data):
+    """Formats one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def sse_response(events):
+    """Streams (event, data) pairs to the browser as server-sent events."""
+    return Response(
+        stream_with_context(sse_event(event, data) for event, data in events),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/generate-cover-letter/stream', methods=['POST'])
+def stream_cover_letter_api():
+    data = request.json
+    job = data.get('job') if data else None
+    if not job:
+        return jsonify({'error': 'Job data is required'}), 400
+    
+    resume_text = session.get('resume_text')
+    if not resume_text:
+        return jsonify({'error': 'Session expired. Please upload resume again.'}), 400
+    
+    resume_hash = session.get('resume_hash')
+    regenerate = bool(data.get('regenerate'))
+    
+    def events():
+        for event, text in stream_cover_letter(resume_text, job, resume_hash, regenerate):
+            yield event, {'text': text}
+        yield 'done', {}
+    
+    return sse_response(events())
+
+def batch_request_jobs(data):
+    """Validates the job list of a batch request; returns (jobs, error response)."""
+    jobs = data.get('jobs') if isinstance(data, dict) else None
+    if not jobs or not isinstance(jobs, list):
+        return None, (jsonify({'error': 'A list of jobs is required'}), 400)
+    if not all(isinstance(job, dict) for job in jobs):
+        return None, (jsonify({'error': 'Each job must be an object'}), 400)
+    if len(jobs) > COVER_LETTER_BATCH_MAX:
+        return None, (jsonify({'error': f'At most {COVER_LETTER_BATCH_MAX} jobs per batch'}), 400)
+    return jobs, None
+
+@app.route('/generate-cover-letters', methods=['POST'])
+def generate_cover_letters_api():
+    try:
+        data = request.json
+        jobs, error = batch_request_jobs(data)
+        if error:
+            return error
+        
+        resume_text = session.get('resume_text')
+        if not resume_text:
+            return jsonify({'error': 'Session expired. Please upload resume again.'}), 400
+        
+        letters = [None] * len(jobs)
+        for index, letter in generate_cover_letters(
+            resume_text, jobs, resume_hash=session.get('resume_hash'), regenerate=bool(data.get('regenerate'))
+        ):
+            letters[index] = letter
+        
+        return jsonify({
+            'success': True,
+            'cover_letters': letters
+        })
+    
+    except Exception as e:
+        print(f"Batch cover letter error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/generate-cover-letters/stream', methods=['POST'])
+def stream_cover_letters_api():
+    data = request.json
+    jobs, error = batch_request_jobs(data)
+    if error:
+        return error
+    
+    resume_text = session.get('resume_text')
+    if not resume_text:
+        return jsonify({'error': 'Session expired. Please upload resume again.'}), 400
+    
+    resume_hash = session.get('resume_hash')
+    regenerate = bool(data.get('regenerate'))
+    
+    def events():
+        for index, letter in generate_cover_letters(resume_text, jobs, resume_hash, regenerate):
+            yield 'letter', {'index': index, 'text': letter}
+        yield 'done', {}
+    
+    return sse_response(events())
+
 @app.route('/analyze-skills', methods=['POST'])
 def analyze_skills_api():
     try:
@@ -179,6 +348,52 @@ def analyze_skills_api():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+@app.route('/analyze-skills/stream', methods=['POST'])
+def stream_analyze_skills_api():
+    data = request.json or {}
+    job_description = data.get('job_description')
+    if not job_description:
+        return jsonify({'error': 'Job description is required'}), 400
+    
+    skills = session.get('skills')
+    if not skills:
+        return jsonify({'error': 'Session expired. Please upload resume again.'}), 400
+    
+    def events():
+        yield from stream_skill_gap_and_courses(skills, job_description)
+        yield 'done', {}
+    
+    return sse_response(events())
+
+@app.route('/analyze-skills/batch', methods=['POST'])
+def analyze_skills_batch_api():
+    data = request.json
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Invalid request format'}), 400
+    # Either plain descriptions or job objects as returned by /search-jobs
+    descriptions = data.get('job_descriptions')
+    jobs = data.get('jobs', [])
+    if not isinstance(descriptions, (list, type(None))) or not isinstance(jobs, list):
+        return jsonify({'error': 'job_descriptions and jobs must be lists'}), 400
+    descriptions = descriptions or [
+        f"{job.get('title', '')}\n{job.get('description', '')}" for job in jobs if isinstance(job, dict)
+    ]
+    if not descriptions:
+        return jsonify({'error': 'Job descriptions are required'}), 400
+    if len(descriptions) > SKILL_GAP_BATCH_MAX:
+        return jsonify({'error': f'At most {SKILL_GAP_BATCH_MAX} job descriptions per request'}), 400
+    
+    skills = session.get('skills')
+    if not skills:
+        return jsonify({'error': 'Session expired. Please upload resume again.'}), 400
+    
+    analysis = analyze_skill_gaps(skills, [str(description) for description in descriptions])
+    
+    return jsonify({
+        'success': True,
+        'analysis': analysis
+    })
+
 @app.route('/get-courses', methods=['POST'])
 def get_courses_api():
     try:
@@ -205,7 +420,7 @@ def research_company_api():
         company_name = data.get('company_name')
         job_title = data.get('job_title')
         
-        research = research_company_for_interview(company_name, job_title)
+        research = research_company_for_interview(company_name, job_title, regenerate=bool(data.get('regenerate')))
         
         return jsonify({
             'success': True,
@@ -218,11 +433,97 @@ def research_company_api():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+@app.route('/research-company/stream', methods=['POST'])
+def stream_research_company_api():
+    data = request.json or {}
+    company_name = data.get('company_name')
+    job_title = data.get('job_title')
+    if not company_name or not job_title:
+        return jsonify({'error': 'Company name and job title are required'}), 400
+    regenerate = bool(data.get('regenerate'))
+    
+    def events():
+        yield from stream_company_research(company_name, job_title, regenerate=regenerate)
+        yield 'done', {}
+    
+    return sse_response(events())
+
+def submit_task(kind, func):
+    """Queues background work for the current session and answers with its task id."""
+    try:
+        task = tasks.submit(kind, func, owner=session.get('session_id'))
+    except TaskQueueFull:
+        return jsonify({'error': 'Server is busy. Please try again shortly.'}), 429
+    return jsonify({'success': True, 'task_id': task['id'], 'status': task['status']}), 202
+
+def task_response(task):
+    if task is None or task['owner'] not in (None, session.get('session_id')):
+        return jsonify({'error': 'Task not found or expired'}), 404
+    return jsonify({'success': True, 'task': {k: v for k, v in task.items() if k != 'owner'}})
+
+@app.route('/tasks/cover-letter', methods=['POST'])
+def cover_letter_task_api():
+    data = request.json
+    job = data.get('job') if data else None
+    if not job:
+        return jsonify({'error': 'Job data is required'}), 400
+    
+    resume_text = session.get('resume_text')
+    if not resume_text:
+        return jsonify({'error': 'Session expired. Please upload resume again.'}), 400
+    
+    resume_hash = session.get('resume_hash')
+    regenerate = bool(data.get('regenerate'))
+    return submit_task('cover_letter', lambda: {
+        'cover_letter': generate_cover_letter(resume_text, job, resume_hash=resume_hash, regenerate=regenerate)
+    })
+
+@app.route('/tasks/research-company', methods=['POST'])
+def research_company_task_api():
+    data = request.json or {}
+    company_name = data.get('company_name')
+    job_title = data.get('job_title')
+    if not company_name or not job_title:
+        return jsonify({'error': 'Company name and job title are required'}), 400
+    
+    regenerate = bool(data.get('regenerate'))
+    return submit_task('research_company', lambda: {
+        'research': research_company_for_interview(company_name, job_title, regenerate=regenerate)
+    })
+
+@app.route('/tasks/<task_id>', methods=['GET'])
+def task_status_api(task_id):
+    # ?wait=N long-polls until the task finishes or N seconds pass
+    wait = min(request.args.get('wait', 0, type=float), app.config['TASK_MAX_WAIT'])
+    task = tasks.wait(task_id, wait) if wait > 0 else tasks.get(task_id)
+    return task_response(task)
+
+@app.route('/tasks/<task_id>', methods=['DELETE'])
+def cancel_task_api(task_id):
+    task = tasks.get(task_id)
+    if task is not None and task['owner'] in (None, session.get('session_id')):
+        task = tasks.cancel(task_id)
+    return task_response(task)
+
+@app.route('/metrics', methods=['GET'])
+def metrics_api():
+    return jsonify({
+        'http': http_client_stats(),
+        'resume_cache': RESUME_CACHE.stats(),
+        'search_cache': SEARCH_CACHE.stats(),
+        'job_search': job_search_stats(),
+        'generated_cache': generated_cache_stats(),
+        'llm_rate_limit': rate_limit_stats(),
+        'tasks': tasks.stats(),
+        'single_flight': SINGLE_FLIGHT.stats()
+    })
+
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("🚀 AI JOB ASSISTANT STARTING")
     print("="*60)
-    print(f"📁 Upload folder: {os.path.abspath(app.config['UPLOAD_FOLDER'])}")
+    if app.config['PERSIST_UPLOADS']:
+        print(f"📁 Upload folder: {os.path.abspath(app.config['UPLOAD_FOLDER'])}")
     print(f"🌐 Server: http://localhost:5000")
     print("="*60 + "\n")
     
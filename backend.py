@@ -1,9 +1,29 @@
+import hashlib
+import io
+import json
 import os
+import random
 import re
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse
+import secrets
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed, wait
+from typing import List, Dict, Any, Optional, Tuple, Iterator, Callable, BinaryIO
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 import pdfplumber
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cache import MemoryCache, SQLiteCache, TieredCache, SingleFlight
+from job_store import JobStore
+from ranking import features, score_documents
+from dedup import MinHasher, cluster_labels
+from taxonomy import TAXONOMY, format_skill
+import llm_client
 
 # --- Configuration ---
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "your_api_key")
@@ -11,52 +31,350 @@ SERPAPI_KEY = os.environ.get("SERPAPI_KEY", "your_SERP_api")
 YOUTUBE_API_KEY = os.environ.get("YOUTUBE_API_KEY", "your_youtube_api")
 
 GEMINI_MODEL = "gemini-2.5-flash"
+# Client-side token bucket matched to the Gemini quota, shared by every generation
+GEMINI_REQUESTS_PER_MINUTE = float(os.environ.get("GEMINI_REQUESTS_PER_MINUTE", "10"))
+GEMINI_BURST = int(os.environ.get("GEMINI_BURST", "10"))
+GEMINI_RATE_LIMIT_WAIT = 30.0  # seconds a call may queue for a slot before falling back
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "8"))  # Gemini calls in flight for batch generation
+COVER_LETTER_BATCH_MAX = 10  # jobs per batch request
+COVER_LETTER_BATCH_TIMEOUT = 90.0  # seconds for a whole batch
+SKILL_GAP_BATCH_MAX = 500  # job descriptions per batch skill-gap request
 YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3/search"
 SERPAPI_URL = "https://serpapi.com/search"
 
+# Outbound HTTP: one pooled keep-alive client shared by every SerpAPI/YouTube call
+HTTP_POOL_CONNECTIONS = 10  # number of hosts to keep pools for
+HTTP_POOL_MAXSIZE = 20  # keep-alive connections per host
+HTTP_MAX_RETRIES = 2  # retries on connection errors, 429 and 5xx
+HTTP_BACKOFF_FACTOR = 0.5  # seconds, doubled per retry and jittered
+HTTP_CONNECT_TIMEOUT = 3.05
+
+# Cached search responses, keyed by endpoint + normalized params (API keys excluded).
+# Set SEARCH_CACHE_PATH to keep them in SQLite across restarts.
+SEARCH_CACHE_PATH = os.environ.get("SEARCH_CACHE_PATH")
+SEARCH_CACHE_MAX_ENTRIES = 2000
+SEARCH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SEARCH_CACHE_TTL = {
+    "jobs": 15 * 60,
+    "company_news": 60 * 60,
+    "company": 6 * 60 * 60,
+    "interview_questions": 24 * 60 * 60,
+    "youtube": 24 * 60 * 60,
+}
+
+# Concurrent outbound lookups (company research fan-out etc.)
+OUTBOUND_MAX_WORKERS = 16
+RESEARCH_TIMEOUT = 20.0  # seconds for all company research lookups together
+COURSE_LOOKUP_TIMEOUT = 12.0  # seconds for all YouTube course lookups of one request
+YOUTUBE_MAX_CONCURRENCY = 4  # YouTube searches in flight across all requests (their own pool)
+
+# Job search: the alternative search is started speculatively once the primary has been
+# running longer than the hedge delay (its recent p90 latency), and the whole search
+# answers within one budget, falling back to the static list.
+JOB_SEARCH_BUDGET = 12.0  # seconds end to end
+JOB_SEARCH_HEDGE_DELAY = 2.5  # seconds, used until enough primary latencies are recorded
+JOB_SEARCH_HEDGE_PERCENTILE = 0.9
+JOB_SEARCH_HEDGE_BOUNDS = (0.5, 6.0)  # clamp for the measured hedge delay
+JOB_SEARCH_LATENCY_SAMPLES = 100  # recent primary latencies kept
+
+# Local job index: every upstream result is stored (SQLite FTS5) and searches are served
+# from it when it has enough fresh matches. Set JOB_STORE_PATH to "" to disable.
+JOB_STORE_PATH = os.environ.get("JOB_STORE_PATH", "jobs.db")
+JOB_STORE_FRESHNESS = 6 * 60 * 60  # seconds a stored job may be served without a refill
+JOB_STORE_RETENTION = 7 * 24 * 60 * 60
+JOB_STORE_MAX_JOBS = 20000
+
+# Job ranking: rank up to this many candidates per job shown and keep the best matches for the resume.
+# An upstream search returns one Google Jobs page (about 10 jobs); the extra candidates come from
+# the local store, and "show more" pages (see JOB SEARCH PAGINATION) reach further upstream.
+JOB_RANK_OVERFETCH = 3
+JOB_RANK_RESUME_CHARS = 4000  # resume text used as ranking context beside its skills
+
+# Job de-duplication: postings with the same normalized link, the same company, title and location,
+# or title+description shingles at least this similar (estimated Jaccard) are merged
+JOB_DEDUP_SIMILARITY = 0.7
+JOB_DEDUP_MIN_SHINGLES = 5  # shorter title+description texts are only merged on link or company and title
+
+# Job pagination: "show more" walks Google Jobs pages behind an opaque cursor kept in SEARCH_CACHE.
+# The page after the one just returned is prefetched into the cache in the background, except after
+# a first page served from the local job store.
+JOB_CURSOR_TTL = 30 * 60
+JOB_PAGE_MAX_UPSTREAM = 3  # upstream pages fetched at most to fill one page of new jobs
+
+# Text extraction engine: "pdfplumber" (full layout analysis), "pypdfium2" or "pdfminer" (text only).
+# Fast engines fall back to pdfplumber when they return no text.
+PDF_BACKEND = os.environ.get("PDF_BACKEND", "pdfplumber")
+
+# Limits for a single PDF, so an enormous upload cannot hold a worker for long
+PDF_MAX_PAGES = 20
+PDF_MAX_CHARS = 100_000
+PDF_TIME_BUDGET = 10.0  # seconds
+
+# Uploads are buffered in memory and only spill to a temp file above this size
+UPLOAD_SPOOL_MAX_BYTES = 2 * 1024 * 1024
+
+# Parsed resumes keyed by the SHA-256 of the PDF bytes; set RESUME_CACHE_PATH to add an on-disk tier
+RESUME_CACHE_PATH = os.environ.get("RESUME_CACHE_PATH")
+RESUME_CACHE_MAX_ENTRIES = 256
+RESUME_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Generated cover letters and interview briefs, keyed by their inputs and the prompt version.
+# Bump a prompt's version when its template changes so older output stops being served.
+GENERATED_CACHE_PATH = os.environ.get("GENERATED_CACHE_PATH")
+GENERATED_CACHE_MAX_ENTRIES = 1000
+GENERATED_CACHE_MAX_BYTES = 16 * 1024 * 1024
+GENERATED_CACHE_TTL = {
+    "cover_letter": 7 * 24 * 60 * 60,
+    "interview_brief": 24 * 60 * 60,
+}
+PROMPT_VERSIONS = {
+    "cover_letter": 1,
+    "interview_brief": 1,
+}
+
+# ============================================
+# HTTP CLIENT
+# ============================================
+class _JitteredRetry(Retry):
+    """Retry with full jitter on the backoff, so retries from many threads don't line up."""
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+def _create_http_session() -> requests.Session:
+    retry = _JitteredRetry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+    http = requests.Session()
+    http.mount("https://", adapter)
+    http.mount("http://", adapter)
+    return http
+
+HTTP_SESSION = _create_http_session()
+
+def http_get(url: str, params: Optional[Dict[str, Any]] = None, timeout: float = 15) -> requests.Response:
+    """GET through the shared connection pool; `timeout` is the read timeout for this call."""
+    return HTTP_SESSION.get(url, params=params, timeout=(min(HTTP_CONNECT_TIMEOUT, timeout), timeout))
+
+def http_client_stats() -> Dict[str, Dict[str, int]]:
+    """Per-host connection reuse: `requests` served over `connections` opened."""
+    stats = {}
+    for adapter in set(HTTP_SESSION.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "requests": pool.num_requests,
+                "connections": pool.num_connections,
+                "reused": max(0, pool.num_requests - pool.num_connections)
+            }
+    return stats
+
+SEARCH_CACHE = TieredCache(
+    MemoryCache(SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_MAX_BYTES),
+    SQLiteCache(SEARCH_CACHE_PATH) if SEARCH_CACHE_PATH else None
+)
+_UNCACHED_PARAMS = {"api_key", "key"}
+SINGLE_FLIGHT = SingleFlight()
+
+def search_cache_key(url: str, params: Dict[str, Any]) -> str:
+    """Cache key for a request: same endpoint and same params up to case and whitespace."""
+    normalized = sorted(
+        (name, " ".join(str(value).lower().split()))
+        for name, value in params.items() if name not in _UNCACHED_PARAMS
+    )
+    return hashlib.sha256(json.dumps([url, normalized]).encode()).hexdigest()
+
+def fetch_json(url: str, params: Dict[str, Any], timeout: float = 15, cache_ttl: Optional[float] = None,
+               on_fetch: Optional[Callable[[float, bool], None]] = None) -> Dict[str, Any]:
+    """GETs a JSON API response, served from SEARCH_CACHE for `cache_ttl` seconds.
+
+    Raises requests.RequestException on failure; failures and API error
+    payloads are never cached. Concurrent identical requests are coalesced.
+    `on_fetch(seconds, ok)` is called after each real upstream round trip,
+    failed or not; cache hits and coalesced callers do not trigger it.
+    """
+    key = search_cache_key(url, params)
+    if cache_ttl:
+        cached = SEARCH_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    def fetch() -> Dict[str, Any]:
+        started = time.monotonic()
+        ok = False
+        try:
+            response = http_get(url, params=params, timeout=timeout)
+            response.raise_for_status()
+            data = response.json()
+            ok = "error" not in data
+        finally:
+            if on_fetch is not None:
+                on_fetch(time.monotonic() - started, ok)
+
+        if cache_ttl and ok:
+            SEARCH_CACHE.set(key, data, ttl=cache_ttl)
+        return data
+
+    # Identical requests already in flight share one upstream call
+    return SINGLE_FLIGHT.do(f"fetch:{key}", fetch)
+
+_OUTBOUND_POOL = ThreadPoolExecutor(max_workers=OUTBOUND_MAX_WORKERS, thread_name_prefix="outbound")
+
+def iter_concurrently(calls: Dict[str, Callable[[], Any]], timeout: float,
+                      default_factory: Callable[[], Any] = list,
+                      pool: Optional[ThreadPoolExecutor] = None) -> Iterator[Tuple[str, Any]]:
+    """Runs the calls on `pool` (the shared outbound pool by default), yielding (name, result) as each finishes.
+
+    Calls that fail or are still running at the deadline yield `default_factory()`,
+    so callers always receive a result for every key.
+    """
+    pool = pool or _OUTBOUND_POOL
+    futures = {pool.submit(call): name for name, call in calls.items()}
+    pending = set(futures)
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            pending.discard(future)
+            name = futures[future]
+            if future.exception() is None:
+                yield name, future.result()
+            else:
+                print(f"⚠️ {name} lookup failed: {future.exception()}")
+                yield name, default_factory()
+    except FuturesTimeoutError:
+        for future in pending:
+            future.cancel()
+            print(f"⚠️ {futures[future]} lookup missed the {timeout:g}s deadline")
+            yield futures[future], default_factory()
+
+def run_concurrently(calls: Dict[str, Callable[[], Any]], timeout: float,
+                     default_factory: Callable[[], Any] = list,
+                     pool: Optional[ThreadPoolExecutor] = None) -> Dict[str, Any]:
+    """Runs the calls on `pool` (the shared outbound pool by default) under one deadline; results keep the order of `calls`."""
+    results = dict(iter_concurrently(calls, timeout, default_factory, pool))
+    return {name: results[name] for name in calls}
+
 # ============================================
 # PDF PROCESSING
 # ============================================
+def _pdfplumber_pages(uploaded_file: Any, max_pages: int) -> Iterator[str]:
+    """pdfplumber text with full layout analysis; the most faithful but slowest engine."""
+    with pdfplumber.open(uploaded_file, pages=range(1, max_pages + 1)) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text() or ""
+            # Drop the page's layout objects before moving on
+            page.close()
+            yield text
+
+def _pypdfium2_pages(uploaded_file: Any, max_pages: int) -> Iterator[str]:
+    """PDFium's native text extraction, no layout analysis in Python."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(uploaded_file)
+    try:
+        for index in range(min(len(pdf), max_pages)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            yield text.replace("\r\n", "\n")
+    finally:
+        pdf.close()
+
+def _pdfminer_pages(uploaded_file: Any, max_pages: int) -> Iterator[str]:
+    """pdfminer with layout analysis disabled: characters in content-stream order."""
+    from pdfminer.converter import TextConverter
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    fp = open(uploaded_file, "rb") if isinstance(uploaded_file, (str, os.PathLike)) else uploaded_file
+    try:
+        resources = PDFResourceManager(caching=True)
+        for page in PDFPage.get_pages(fp, maxpages=max_pages):
+            output = io.StringIO()
+            device = TextConverter(resources, output, laparams=None)
+            PDFPageInterpreter(resources, device).process_page(page)
+            device.close()
+            yield output.getvalue().rstrip("\f")
+    finally:
+        if fp is not uploaded_file:
+            fp.close()
+
+PDF_BACKENDS: Dict[str, Callable[[Any, int], Iterator[str]]] = {
+    "pdfplumber": _pdfplumber_pages,
+    "pypdfium2": _pypdfium2_pages,
+    "pdfminer": _pdfminer_pages,
+}
+
+def iter_pdf_pages(uploaded_file: Any, max_pages: int = PDF_MAX_PAGES, max_chars: int = PDF_MAX_CHARS,
+                   time_budget: float = PDF_TIME_BUDGET, backend: Optional[str] = None) -> Iterator[str]:
+    """Yields the text of each non-empty page, stopping at the page, character or time limit.
+
+    Each page's layout objects are released as soon as its text is out. The
+    time budget is checked between pages. If the selected backend fails or
+    finds no text at all, the file is read again with pdfplumber.
+    """
+    backend = backend or PDF_BACKEND
+    deadline = time.monotonic() + time_budget
+    remaining = max_chars
+    engines = [backend] if backend == "pdfplumber" else [backend, "pdfplumber"]
+
+    for engine in engines:
+        found_text = False
+        try:
+            if hasattr(uploaded_file, "seek"):
+                uploaded_file.seek(0)
+            for page_number, text in enumerate(PDF_BACKENDS[engine](uploaded_file, max_pages), 1):
+                if text.strip():
+                    found_text = True
+                    yield text[:remaining]
+                    remaining -= len(text)
+                if remaining <= 0:
+                    print(f"⚠️ PDF character budget reached at page {page_number}")
+                    return
+                if time.monotonic() > deadline:
+                    print(f"⚠️ PDF time budget reached at page {page_number}")
+                    return
+        except Exception as e:
+            print(f"Error processing PDF file with {engine}: {e}")
+
+        if found_text:
+            return
+        if engine != "pdfplumber":
+            print(f"⚠️ {engine} returned no text, falling back to pdfplumber")
+
 def load_pdf_text(uploaded_file: Any) -> str:
     """Extracts text from an uploaded PDF file."""
-    try:
-        with pdfplumber.open(uploaded_file) as pdf:
-            return "\n".join(page.extract_text() or "" for page in pdf.pages).strip()
-    except Exception as e:
-        print(f"Error processing PDF file: {e}")
-        return ""
+    return "\n".join(iter_pdf_pages(uploaded_file)).strip()
 
 # ============================================
 # RESUME ANALYSIS
 # ============================================
 def extract_resume_skills(resume_text: str) -> List[str]:
     """Identifies technical skills in the resume text."""
-    skill_categories = {
-    "Programming Languages": ["python", "java", "c++", "javascript", "typescript", "sql", "nosql", "go", "rust", "c#", "php", "ruby", "swift", "kotlin", "perl", "scala", "haskell", "r", "matlab", "dart", "lua"],
-    "AI/ML": ["ai", "ml", "nlp", "deep learning", "computer vision", "pytorch", "tensorflow", "keras", "scikit-learn", "machine learning", "neural networks", "llm", "natural language processing", "robotics", "reinforcement learning", "gpt", "bert", "transformers", "langchain", "hugging face", "openai", "gemini"],
-    "Cloud & DevOps": ["cloud", "aws", "gcp", "azure", "docker", "kubernetes", "git", "ci/cd", "jenkins", "terraform", "ansible", "devops", "serverless", "microservices", "gitlab", "github actions", "circleci", "cloudformation", "helm", "prometheus", "grafana"],
-    "Frameworks & Libraries": ["react", "angular", "vue", "node", "express", "django", "flask", "spring", "fastapi", "next.js", "svelte", "ember", "backbone", "jquery", "bootstrap", "tailwind", "material-ui", "redux", "webpack", "vite", "nest.js", "laravel", "rails", "asp.net"],
-    "Mobile Development": ["android", "ios", "react native", "flutter", "xamarin", "ionic", "swift", "kotlin", "objective-c", "mobile app development", "app store", "play store"],
-    "Game Development": ["unity", "unreal engine", "godot", "game development", "3d modeling", "blender", "maya", "game design", "c++", "c#", "opengl", "directx", "vulkan", "shader programming", "physics engine", "ar", "vr", "augmented reality", "virtual reality"],
-    "Data & Analytics": ["data science", "data analysis", "statistics", "spark", "hadoop", "kafka", "elasticsearch", "etl", "data engineering", "big data", "data visualization", "business intelligence", "tableau", "power bi", "looker", "pandas", "numpy", "matplotlib", "seaborn", "jupyter", "airflow", "dbt"],
-    "Web Development": ["html", "css", "rest api", "graphql", "microservices", "web development", "frontend", "backend", "full stack", "web security", "web performance", "sass", "less", "webpack", "responsive design", "seo", "pwa", "webassembly"],
-    "Databases": ["mongodb", "postgresql", "mysql", "redis", "cassandra", "dynamodb", "oracle", "sql server", "firebase", "supabase", "prisma", "sequelize", "typeorm", "sqlite", "mariadb", "neo4j", "couchdb", "elasticsearch"],
-    "Methodologies & Practices": ["agile", "scrum", "kanban", "devops", "tdd", "bdd", "ci/cd", "continuous integration", "continuous deployment", "pair programming", "code review", "design patterns", "clean code", "solid principles", "microservices architecture"],
-    "Cybersecurity": ["security", "cybersecurity", "network security", "application security", "data security", "compliance", "risk management", "penetration testing", "ethical hacking", "vulnerability assessment", "encryption", "authentication", "authorization", "owasp", "soc", "siem"],
-    "Networking": ["networking", "tcp/ip", "dns", "http", "https", "network architecture", "network administration", "vpn", "firewall", "load balancing", "cdn", "websockets"], 
-    "Operating Systems": ["linux", "windows", "macos", "unix", "ubuntu", "centos", "debian", "redhat", "bash", "powershell", "shell scripting"],    
-    "Blockchain & Web3": ["blockchain", "web3", "ethereum", "solidity", "smart contracts", "cryptocurrency", "nft", "defi", "bitcoin", "polygon", "hyperledger"],  
-    "Design & UI/UX": ["ui/ux", "figma", "sketch", "adobe xd", "photoshop", "illustrator", "user experience", "user interface", "wireframing", "prototyping", "design thinking", "accessibility"],
-    "Testing & QA": ["testing", "unit testing", "integration testing", "e2e testing", "selenium", "cypress", "jest", "mocha", "pytest", "junit", "automation testing", "manual testing", "qa", "quality assurance"],
-    "Version Control": ["git", "github", "gitlab", "bitbucket", "svn", "version control", "source control"],
-    "Project Management": ["jira", "trello", "asana", "monday.com", "project management", "product management", "stakeholder management"],
-}
-    
-    all_skills = [skill for category in skill_categories.values() for skill in category]
-    resume_lower = resume_text.lower()
-    found_skills = {skill.title() if not skill.isupper() else skill for skill in all_skills if skill in resume_lower}
-    
-    return list(found_skills) if found_skills else ["Software Engineer"]
+    found_skills = [format_skill(skill) for skill in TAXONOMY.matcher.find_skills(resume_text)]
+
+    return found_skills if found_skills else ["Software Engineer"]
+
+def extract_resume_text_and_skills(pages: Iterator[str]) -> Tuple[str, List[str]]:
+    """Consumes a page stream, matching skills page by page as the text arrives."""
+    texts: List[str] = []
+    found: Dict[str, None] = {}
+    for page_text in pages:
+        texts.append(page_text)
+        found.update(dict.fromkeys(TAXONOMY.matcher.find_skills(page_text)))
+
+    found_skills = [format_skill(skill) for skill in found]
+    return "\n".join(texts).strip(), found_skills if found_skills else ["Software Engineer"]
 
 def extract_resume_details(resume_text: str) -> Dict[str, Optional[str]]:
     """Extracts contact information from the resume."""
@@ -85,6 +403,103 @@ def extract_resume_details(resume_text: str) -> Dict[str, Optional[str]]:
             
     return details
 
+# ============================================
+# PARSED RESUME CACHE
+# ============================================
+RESUME_CACHE = TieredCache(
+    MemoryCache(RESUME_CACHE_MAX_ENTRIES, RESUME_CACHE_MAX_BYTES),
+    SQLiteCache(RESUME_CACHE_PATH) if RESUME_CACHE_PATH else None
+)
+
+def spool_upload(stream: BinaryIO, chunk_size: int = 64 * 1024) -> Tuple[BinaryIO, str]:
+    """Hashes an upload stream, buffering it in memory if it cannot be rewound.
+
+    Returns a rewound readable buffer and the SHA-256 of its contents.
+    """
+    digest = hashlib.sha256()
+    if getattr(stream, "seekable", lambda: False)():
+        # Werkzeug has already spooled the file part; hash it in place
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            digest.update(chunk)
+        stream.seek(0)
+        return stream, digest.hexdigest()
+
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_BYTES)
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        digest.update(chunk)
+        spool.write(chunk)
+    spool.seek(0)
+    return spool, digest.hexdigest()
+
+def parse_resume(pdf: BinaryIO, resume_hash: str) -> Tuple[Dict[str, Any], bool]:
+    """Extracts text, skills and contact details from a PDF, reusing the result for identical files.
+
+    Returns the parsed resume and whether it came from the cache.
+    """
+    cached = RESUME_CACHE.get(resume_hash)
+    if cached is not None:
+        return cached, True
+
+    resume_text, skills = extract_resume_text_and_skills(iter_pdf_pages(pdf))
+    parsed = {
+        "hash": resume_hash,
+        "text": resume_text,
+        "skills": skills,
+        "details": extract_resume_details(resume_text)
+    }
+
+    # Don't pin a failed extraction; the next upload should retry it
+    if resume_text:
+        RESUME_CACHE.set(resume_hash, parsed)
+    return parsed, False
+
+# ============================================
+# UPLOAD STORAGE (opt-in)
+# ============================================
+_last_upload_sweep = 0.0
+_upload_sweep_lock = threading.Lock()
+
+def persist_resume(pdf: BinaryIO, resume_hash: str, folder: str) -> str:
+    """Saves an upload under its content hash, so identical files are stored once."""
+    os.makedirs(folder, exist_ok=True)
+    filepath = os.path.join(folder, f"{resume_hash}.pdf")
+    if not os.path.exists(filepath):
+        pdf.seek(0)
+        tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(pdf, f)
+        os.replace(tmp_path, filepath)
+    else:
+        # Refresh the timestamp so the retention sweep keeps files still in use
+        os.utime(filepath)
+    return filepath
+
+def sweep_uploads(folder: str, max_age: float, interval: float = 600) -> int:
+    """Deletes saved uploads older than `max_age` seconds, at most once per `interval`."""
+    global _last_upload_sweep
+
+    now = time.time()
+    with _upload_sweep_lock:
+        if now - _last_upload_sweep < interval:
+            return 0
+        _last_upload_sweep = now
+
+    removed = 0
+    try:
+        for entry in os.scandir(folder):
+            if entry.is_file() and now - entry.stat().st_mtime > max_age:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+    except FileNotFoundError:
+        return 0
+
+    if removed:
+        print(f"🧹 Removed {removed} expired uploads")
+    return removed
+
 # ============================================
 # HELPER FUNCTIONS FOR JOB SEARCH
 # ============================================
@@ -114,12 +529,85 @@ def _clean_job_title(title: str) -> str:
     """Helper function to remove company names and other noise from job titles."""
     return re.split(r' - | \| | at ', title)[0].strip()
 
+# ============================================
+# JOB DE-DUPLICATION
+# ============================================
+_TRACKING_PARAMS = {"gclid", "fbclid", "ref", "refid", "src", "source", "trk", "trackingid", "utm_id"}
+_COMPANY_SUFFIXES = re.compile(
+    r"\b(private limited|pvt\.? ltd\.?|pvt|ltd\.?|limited|inc\.?|llc|llp|corp\.?|corporation|co\.?|gmbh|plc)$"
+)
+_JOB_DEDUPER = MinHasher()
+
+def _normalize_job_url(url: str) -> str:
+    """Link identity for a posting: lowercase host without www, no fragment, tracking params or trailing slash."""
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    host = host[4:] if host.startswith("www.") else host
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in _TRACKING_PARAMS
+    )
+    return urlunparse(("", host, parsed.path.rstrip("/"), "", urlencode(query), ""))
+
+def _canonical_company(job: Dict[str, Any]) -> str:
+    """Company name reduced to comparable form ("Flipkart Pvt. Ltd." -> "flipkart")."""
+    company = job.get("company", "")
+    if not company or company == "Unknown Company":
+        # Only the "Title - Company" form; a link's domain is often a job board, not the employer
+        company = _extract_company_name(job.get("title", ""), "", "")
+    company = " ".join(re.sub(r"[^\w\s]", " ", company.lower()).split())
+    return _COMPANY_SUFFIXES.sub("", company).strip()
+
+def _canonical_title(title: str) -> str:
+    return " ".join(re.sub(r"[^\w\s+#]", " ", _clean_job_title(title).lower()).split())
+
+def dedupe_jobs(jobs: List[Dict[str, Any]], threshold: float = JOB_DEDUP_SIMILARITY) -> List[Dict[str, Any]]:
+    """Drops repeated postings, keeping the first of each cluster in the original order.
+
+    Jobs are merged when their normalized links match, when company, title and
+    location match after canonicalization, or when MinHash estimates their title and
+    description shingles to be at least `threshold` similar. Candidate pairs
+    come from LSH buckets, so this stays near-linear in the number of jobs.
+    """
+    if len(jobs) < 2:
+        return jobs
+    pairs: List[Tuple[int, int]] = []
+
+    first_by_key: Dict[Any, int] = {}
+    for index, job in enumerate(jobs):
+        keys = []
+        link = _normalize_job_url(job.get("link", ""))
+        if link.startswith("//"):  # has a host; "#" and "" are placeholders, not identities
+            keys.append(("link", link))
+        company = _canonical_company(job)
+        if company and company != "unknown company":
+            location = " ".join(job.get("location", "").lower().split())
+            keys.append(("role", company, _canonical_title(job.get("title", "")), location))
+        for key in keys:
+            if key in first_by_key:
+                pairs.append((first_by_key[key], index))
+            else:
+                first_by_key[key] = index
+
+    signatures = _JOB_DEDUPER.signatures([
+        f"{_canonical_title(job.get('title', ''))} {job.get('description', '')}" for job in jobs
+    ], JOB_DEDUP_MIN_SHINGLES)
+    pairs.extend(
+        (first, second) for first, second in _JOB_DEDUPER.candidate_pairs(signatures)
+        if _JOB_DEDUPER.similarity(signatures[first], signatures[second]) >= threshold
+    )
+
+    labels = cluster_labels(len(jobs), pairs)
+    unique = [job for index, job in enumerate(jobs) if labels[index] == index]
+    if len(unique) < len(jobs):
+        print(f"🧹 Removed {len(jobs) - len(unique)} duplicate job postings")
+    return unique
+
 # ============================================
 # JOB SEARCH
 # ============================================
-def search_jobs(skills, location: str = "India", limit: int = 8) -> List[Dict[str, Any]]:
-    """Fetches job listings from SerpAPI Google Jobs."""
-    
+def _job_search_skills(skills) -> List[str]:
+    """Normalizes the skills argument (dict of categories or list) into a list for queries."""
     # ✅ FIX: Handle both dict and list inputs
     all_skills = []
     
@@ -133,67 +621,247 @@ def search_jobs(skills, location: str = "India", limit: int = 8) -> List[Dict[st
     else:
         print(f"⚠️ Unexpected skills type: {type(skills)}")
         all_skills = ["software engineer"]
+    return all_skills
+
+class _LatencyWindow:
+    """Recent latencies of one upstream call, for percentile-based hedge delays."""
+
+    def __init__(self, size: int, min_samples: int = 10):
+        self.min_samples = min_samples
+        self._samples: "deque[float]" = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+_primary_search_latency = _LatencyWindow(JOB_SEARCH_LATENCY_SAMPLES)
+_job_search_stats = {
+    "local": 0, "searches": 0, "hedged": 0, "primary": 0, "alternative": 0, "fallback": 0,
+    "pages": 0, "prefetched": 0
+}
+_job_search_stats_lock = threading.Lock()
+
+def _count_job_search(field: str) -> None:
+    with _job_search_stats_lock:
+        _job_search_stats[field] += 1
+
+def job_search_hedge_delay() -> float:
+    """Seconds to wait on the primary search before starting the alternative one."""
+    measured = _primary_search_latency.percentile(JOB_SEARCH_HEDGE_PERCENTILE)
+    if measured is None:
+        return JOB_SEARCH_HEDGE_DELAY
+    low, high = JOB_SEARCH_HEDGE_BOUNDS
+    return min(max(measured, low), high)
+
+def job_search_stats() -> Dict[str, Any]:
+    with _job_search_stats_lock:
+        stats: Dict[str, Any] = dict(_job_search_stats)
+    stats["hedge_delay"] = round(job_search_hedge_delay(), 3)
+    if JOB_STORE is not None:
+        stats["store"] = JOB_STORE.stats()
+    return stats
+
+JOB_STORE = JobStore(JOB_STORE_PATH, JOB_STORE_MAX_JOBS, JOB_STORE_RETENTION) if JOB_STORE_PATH else None
+
+def _index_jobs(jobs: List[Dict[str, Any]], location: str) -> None:
+    """Adds upstream results to the local job store, tagged with their canonical skills."""
+    if JOB_STORE is None or not jobs:
+        return
+    try:
+        skills = [TAXONOMY.matcher.find_skills(f"{job.get('title', '')} {job.get('description', '')}") for job in jobs]
+        JOB_STORE.upsert(jobs, skills, location)
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not index jobs: {e}")
+
+def rank_jobs(jobs: List[Dict[str, Any]], resume_skills: List[str], resume_text: str = "",
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Re-ranks jobs by TF-IDF similarity to the resume, best first.
+
+    Each job gains `match_score` (0-100) and `matched_skills`, the resume skills
+    it mentions. All jobs are scored in one sparse matrix product.
+    """
+    wanted = _resume_skill_ids(resume_skills)
+    resume_ids = list(wanted)
+    texts = [f"{job.get('title', '')} {job.get('description', '')}" for job in jobs]
+    job_skills = [TAXONOMY.matcher.find_skills(text) for text in texts]
+
+    query = features(resume_text[:JOB_RANK_RESUME_CHARS], resume_ids)
+    scores = score_documents(query, [features(text, skills) for text, skills in zip(texts, job_skills)])
+
+    ranked = [
+        dict(job, match_score=round(100 * score, 1), matched_skills=[wanted[skill] for skill in skills if skill in wanted])
+        for job, skills, score in zip(jobs, job_skills, scores)
+    ]
+    ranked.sort(key=lambda job: job["match_score"], reverse=True)
+    return ranked[:limit] if limit is not None else ranked
+
+def find_jobs(skills, location: str = "India", limit: int = 8, resume_text: str = "") -> Tuple[List[Dict[str, Any]], str]:
+    """Returns (jobs, source): from the local store when it has `limit` fresh matches, else from upstream.
+
+    `source` is "local", "upstream", or "fallback" when the upstream search
+    failed and the static FALLBACK_JOBS stand in for its results.
+
+    Up to JOB_RANK_OVERFETCH x `limit` candidates are ranked and the best `limit`
+    for the resume are returned by rank_jobs. A refill costs one upstream page
+    (about 10 jobs), so the rest of the candidates come from the store.
+    """
+    candidates = limit * JOB_RANK_OVERFETCH
+    skill_list = _job_search_skills(skills)
+    skill_ids = list(dict.fromkeys(TAXONOMY.canonical(skill) or skill.lower() for skill in skill_list))
+    if JOB_STORE is None or not skill_ids:
+        jobs = search_jobs(skills, location, candidates)
+        return rank_jobs(dedupe_jobs(jobs), skill_list, resume_text, limit), _upstream_source(jobs)
+
+    try:
+        local = JOB_STORE.search(skill_ids, location, candidates, JOB_STORE_FRESHNESS)
+    except sqlite3.Error as e:
+        print(f"⚠️ Local job search failed: {e}")
+        local = []
+    if len(local) >= limit:
+        print(f"✅ Returning jobs from the local store ({len(local)} candidates)")
+        _count_job_search("local")
+        return rank_jobs(dedupe_jobs(local), skill_list, resume_text, limit), "local"
+
+    jobs = search_jobs(skills, location, candidates)
+    try:
+        stored = JOB_STORE.search(skill_ids, location, candidates, JOB_STORE_FRESHNESS)
+    except sqlite3.Error:
+        stored = []
+    links = {job["link"] for job in stored}
+    merged = stored + [job for job in jobs if job["link"] not in links]
+    return rank_jobs(dedupe_jobs(merged), skill_list, resume_text, limit), _upstream_source(jobs)
+
+def _upstream_source(jobs: List[Dict[str, Any]]) -> str:
+    return "fallback" if jobs == FALLBACK_JOBS else "upstream"
+
+def search_jobs(skills, location: str = "India", limit: int = 8, budget: float = JOB_SEARCH_BUDGET) -> List[Dict[str, Any]]:
+    """Fetches job listings, hedging the Google Jobs search with the alternative one.
+
+    The primary search starts at once; the alternative starts when the primary
+    fails, comes back empty, or is still running after the hedge delay. The
+    first non-empty result wins, and the static fallback list is returned if
+    neither has one within `budget` seconds.
+    """
+    all_skills = _job_search_skills(skills)
+    start = time.monotonic()
+    deadline = start + budget
+    hedge_at = start + job_search_hedge_delay()
+    _count_job_search("searches")
+
+    primary = _OUTBOUND_POOL.submit(_search_jobs_primary, all_skills, location, limit, budget)
+    pending = {primary: "primary"}
+    alternative = None
+
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            print(f"⚠️ Job search exceeded its {budget:g}s budget")
+            break
+        if alternative is None and (primary not in pending or now >= hedge_at):
+            if primary in pending:
+                print(f"⏱️ Primary search slower than {hedge_at - start:.2f}s, starting alternative search")
+                _count_job_search("hedged")
+            alternative = _OUTBOUND_POOL.submit(_search_jobs_organic, all_skills, location, limit, deadline - now)
+            pending[alternative] = "alternative"
+        if not pending:
+            break
+
+        wake_at = deadline if alternative is not None else min(hedge_at, deadline)
+        done, _ = wait(pending, timeout=wake_at - now, return_when=FIRST_COMPLETED)
+        for future in done:
+            source = pending.pop(future)
+            jobs = future.result() if future.exception() is None else []
+            if jobs:
+                # A search that already started cannot be interrupted; it finishes into the cache
+                for loser in pending:
+                    loser.cancel()
+                print(f"✅ Returning {len(jobs)} jobs from {source} search")
+                _count_job_search(source)
+                return jobs
+
+    for future in pending:
+        future.cancel()
+    print("⚠️ Using fallback jobs")
+    _count_job_search("fallback")
+    return [dict(job) for job in FALLBACK_JOBS]
+
+def _search_jobs_primary(all_skills: List[str], location: str, limit: int, timeout: float = 15) -> List[Dict[str, Any]]:
+    """Google Jobs search via SerpAPI; returns [] on failure."""
+    params = _google_jobs_params(all_skills, location)
+    print(f"🔎 Job search query: {params['q']}")
     
+    try:
+        jobs, _ = _fetch_google_jobs_page(params, timeout, _primary_search_latency)
+        return jobs[:limit]
+        
+    except requests.RequestException as e:
+        print(f"❌ SerpAPI job search failed: {e}")
+        return []
+
+def _google_jobs_params(all_skills: List[str], location: str, page_token: Optional[str] = None) -> Dict[str, Any]:
     # Use top skills for query
     top_skills = all_skills[:5] if all_skills else ["software engineer"]
-    query = f"{' '.join(top_skills)} jobs in {location}"
-    
-    print(f"🔎 Job search query: {query}")
-    
     params = {
         "engine": "google_jobs",
-        "q": query,
+        "q": f"{' '.join(top_skills)} jobs in {location}",
         "api_key": SERPAPI_KEY,
         "location": location,
         "hl": "en",
         "gl": "in"
     }
-    
-    try:
-        response = requests.get(SERPAPI_URL, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-
-        print(f"✅ API Response: {len(data.get('jobs_results', []))} jobs found")
-
-        jobs = []
-        for item in data.get("jobs_results", [])[:limit]:
-            apply_options = item.get("apply_options", [])
-            link = apply_options[0].get("link") if apply_options else item.get("share_url", "#")
-            description = item.get("description", "")
-            
-            jobs.append({
-                "title": item.get("title", "Untitled"),
-                "company": item.get("company_name", "Unknown Company"),
-                "location": item.get("location", location),
-                "description": description[:300] + "..." if len(description) > 300 else description,
-                "link": link,
-            })
+    if page_token:
+        params["next_page_token"] = page_token
+    return params
+
+def _fetch_google_jobs_page(params: Dict[str, Any], timeout: float = 15,
+                            latency: Optional[_LatencyWindow] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """One page of Google Jobs results and the token for the page after it (None on the last page).
+
+    Upstream round trips, including failed ones, are recorded in `latency`;
+    cache hits are not. Raises requests.RequestException on failure.
+    """
+    fetched = []
+
+    def on_fetch(seconds: float, ok: bool) -> None:
+        fetched.append(ok)
+        if latency is not None:
+            latency.record(seconds)
+
+    data = fetch_json(SERPAPI_URL, params, timeout=min(timeout, 15), cache_ttl=SEARCH_CACHE_TTL["jobs"],
+                      on_fetch=on_fetch)
+    print(f"✅ API Response: {len(data.get('jobs_results', []))} jobs found")
+
+    jobs = []
+    for item in data.get("jobs_results", []):
+        apply_options = item.get("apply_options", [])
+        link = apply_options[0].get("link") if apply_options else item.get("share_url", "#")
+        description = item.get("description", "")
         
-        if jobs:
-            print(f"✅ Returning {len(jobs)} jobs from primary search")
-            return jobs
-        
-    except requests.RequestException as e:
-        print(f"❌ SerpAPI job search failed: {e}")
-
-    return search_jobs_alternative(all_skills, location, limit)
-
-
-def search_jobs_alternative(skills, location: str, limit: int) -> List[Dict[str, Any]]:
-    """Alternative job search using general Google search via SerpAPI."""
-    
-    # ✅ Ensure skills is a list
-    if isinstance(skills, dict):
-        all_skills = []
-        for skill_list in skills.values():
-            all_skills.extend(skill_list[:3])
-        skills = all_skills
-    elif isinstance(skills, list):
-        skills = skills[:10]  # Already a list, just limit it
-    else:
-        skills = ["software engineer"]
-    
+        jobs.append({
+            "title": item.get("title", "Untitled"),
+            "company": item.get("company_name", "Unknown Company"),
+            "location": item.get("location", params["location"]),
+            "description": description[:300] + "..." if len(description) > 300 else description,
+            "link": link,
+        })
+    # Everything upstream returned goes into the local store, not just what is shown;
+    # cache hits were indexed when they were fetched, and re-indexing would refresh `seen`
+    if any(fetched):
+        _index_jobs(jobs, params["location"])
+    return jobs, data.get("serpapi_pagination", {}).get("next_page_token")
+
+
+def _search_jobs_organic(skills, location: str, limit: int, timeout: float = 15) -> List[Dict[str, Any]]:
+    """Job postings picked out of general Google results; returns [] on failure."""
+    skills = _job_search_skills(skills)
     top_skills = skills[:3] if skills else ["software engineer"]
     query = f"{' '.join(top_skills)} job openings {location} apply 2025"
     
@@ -209,9 +877,9 @@ def search_jobs_alternative(skills, location: str, limit: int) -> List[Dict[str,
     }
 
     try:
-        response = requests.get(SERPAPI_URL, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        fetched = []
+        data = fetch_json(SERPAPI_URL, params, timeout=min(timeout, 15), cache_ttl=SEARCH_CACHE_TTL["jobs"],
+                          on_fetch=lambda seconds, ok: fetched.append(ok))
 
         print(f"✅ Alternative API Response: {len(data.get('organic_results', []))} results")
 
@@ -243,99 +911,242 @@ def search_jobs_alternative(skills, location: str, limit: int) -> List[Dict[str,
                 if len(jobs) >= limit:
                     break
         
-        if jobs:
-            print(f"✅ Returning {len(jobs)} jobs from alternative search")
-            return jobs
-        else:
-            print("⚠️ No jobs found in alternative search, using fallback")
+        if not jobs:
+            print("⚠️ No jobs found in alternative search")
+        if any(fetched):  # only upstream responses, not cache hits
+            _index_jobs(jobs, location)
+        return jobs
 
     except requests.RequestException as e:
         print(f"❌ Alternative job search failed: {e}")
+        return []
+
+# Fallback jobs with legitimate links
+FALLBACK_JOBS = [
+    {
+        "title": "Software Engineer",
+        "company": "Flipkart",
+        "location": "Bangalore, India",
+        "description": "Join India's leading e-commerce company. Work on scalable systems serving millions of users daily.",
+        "link": "https://www.flipkartcareers.com/"
+    },
+    {
+        "title": "Full Stack Developer",
+        "company": "Razorpay",
+        "location": "Bangalore, India",
+        "description": "Build innovative payment solutions. Work with modern tech stack and fintech products.",
+        "link": "https://razorpay.com/jobs/"
+    },
+    {
+        "title": "Backend Engineer",
+        "company": "Swiggy",
+        "location": "Bangalore, India",
+        "description": "Build real-time systems for food delivery. Work with microservices and high-scale architecture.",
+        "link": "https://careers.swiggy.com/"
+    },
+    {
+        "title": "Data Scientist",
+        "company": "PhonePe",
+        "location": "Bangalore, India",
+        "description": "Work on ML models for fraud detection and recommendations. Analyze payment data at scale.",
+        "link": "https://www.phonepe.com/careers/"
+    },
+    {
+        "title": "ML Engineer",
+        "company": "Ola",
+        "location": "Bangalore, India",
+        "description": "Build ML systems for ride allocation and demand prediction. Work with real-time data.",
+        "link": "https://www.olacabs.com/careers"
+    },
+    {
+        "title": "Frontend Developer",
+        "company": "CRED",
+        "location": "Bangalore, India",
+        "description": "Create premium user experiences. Work with React, animations, and modern design systems.",
+        "link": "https://careers.cred.club/"
+    },
+    {
+        "title": "DevOps Engineer",
+        "company": "Zomato",
+        "location": "Gurugram, India",
+        "description": "Manage cloud infrastructure and deployment pipelines. Work with AWS and Kubernetes.",
+        "link": "https://www.zomato.com/careers"
+    },
+    {
+        "title": "Software Developer",
+        "company": "Freshworks",
+        "location": "Chennai, India",
+        "description": "Build SaaS products used by businesses worldwide. Work on customer engagement platforms.",
+        "link": "https://www.freshworks.com/company/careers/"
+    }
+]
+
+# ============================================
+# JOB SEARCH PAGINATION
+# ============================================
+def _job_cursor_key(cursor: str) -> str:
+    return f"job-cursor:{cursor}"
+
+def _save_job_cursor(state: Dict[str, Any], prefetch: bool = True) -> Optional[str]:
+    """Stores a pagination state, optionally prefetching its next page; None when nothing is left."""
+    if state["page_token"] is None and not state["pending"]:
+        return None
+    cursor = secrets.token_urlsafe(16)
+    SEARCH_CACHE.set(_job_cursor_key(cursor), state, ttl=JOB_CURSOR_TTL)
+    if prefetch and state["page_token"] is not None and len(state["pending"]) < state["limit"]:
+        _OUTBOUND_POOL.submit(_prefetch_jobs_page, state)
+    return cursor
+
+def _prefetch_jobs_page(state: Dict[str, Any]) -> None:
+    # Runs while the user reads the current page: the same walk next_jobs_page will
+    # make, so every upstream response it needs is already in SEARCH_CACHE
+    _walk_job_pages(state)
+    _count_job_search("prefetched")
+
+def _posting_key(job: Dict[str, Any]) -> str:
+    """Identity of a posting across pages: its link, or company, title and location when the link is a placeholder."""
+    link = _normalize_job_url(job.get("link", ""))
+    if link.startswith("//"):
+        return link
+    location = " ".join(job.get("location", "").lower().split())
+    return f"role:{_canonical_company(job)}|{_canonical_title(job.get('title', ''))}|{location}"
+
+def _walk_job_pages(state: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[str], set, bool]:
+    """Fetches upstream pages until there are `limit` unseen postings.
+
+    Returns (candidates, page_token, seen, failed); `failed` is set when an
+    upstream page could not be fetched.
+    """
+    seen = set(state["seen"])
+    page_token = state["page_token"]
+    candidates = list(state["pending"])
+    deadline = time.monotonic() + JOB_SEARCH_BUDGET
+
+    for _ in range(JOB_PAGE_MAX_UPSTREAM):
+        if page_token is None or len(candidates) >= state["limit"]:
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        params = _google_jobs_params(state["skills"], state["location"], page_token)
+        try:
+            jobs, page_token = _fetch_google_jobs_page(params, remaining)
+        except requests.RequestException as e:
+            print(f"❌ SerpAPI job page failed: {e}")
+            return candidates, page_token, seen, True
+        for job in jobs:
+            key = _posting_key(job)
+            if key not in seen:
+                seen.add(key)
+                candidates.append(job)
+    return candidates, page_token, seen, False
+
+def start_job_pagination(skills, location: str, limit: int, shown: List[Dict[str, Any]],
+                         source: str = "upstream") -> Optional[str]:
+    """Cursor for the jobs after a first page from find_jobs (`source` as find_jobs returned it).
+
+    Later pages walk Google Jobs from its first page, skipping the postings
+    already shown, so a first page served from the local store continues
+    with upstream results too. The second page is only prefetched after an
+    upstream first page: a local answer spent no SerpAPI quota, and a user
+    who never asks for more should not spend any either. A "fallback" first
+    page gets no cursor, since upstream has just failed.
+    """
+    if source == "fallback":
+        return None
+    return _save_job_cursor({
+        "skills": _job_search_skills(skills),
+        "location": location,
+        "limit": limit,
+        "page_token": "",  # "" is the first upstream page, None means past the last one
+        "pending": [],
+        "seen": [_posting_key(job) for job in shown],
+    }, prefetch=source == "upstream")
+
+def next_jobs_page(cursor: str, resume_text: str = "") -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """Returns (jobs, next_cursor) for a cursor, or None if it is unknown or expired.
+
+    Upstream pages are fetched until there are `limit` unseen postings, or at
+    most JOB_PAGE_MAX_UPSTREAM of them; ranked postings that do not fit on
+    this page are carried over to the next one. Reusing a cursor returns the
+    same page. When upstream fails before anything new was found, the same
+    cursor comes back so asking again retries, and nothing is prefetched.
+    """
+    state = SEARCH_CACHE.get(_job_cursor_key(cursor))
+    if state is None:
+        return None
+    _count_job_search("pages")
+    limit = state["limit"]
+    candidates, page_token, seen, failed = _walk_job_pages(state)
+    if failed and not candidates:
+        return [], cursor
+
+    ranked = rank_jobs(dedupe_jobs(candidates), state["skills"], resume_text)
+    next_state = dict(state, page_token=page_token, pending=ranked[limit:], seen=sorted(seen))
+    return ranked[:limit], _save_job_cursor(next_state, prefetch=not failed)
+# ============================================
+# GENERATED CONTENT CACHE
+# ============================================
+GENERATED_CACHE = TieredCache(
+    MemoryCache(GENERATED_CACHE_MAX_ENTRIES, GENERATED_CACHE_MAX_BYTES),
+    SQLiteCache(GENERATED_CACHE_PATH) if GENERATED_CACHE_PATH else None
+)
+_generated_stats = {kind: {"hits": 0, "misses": 0, "regenerated": 0} for kind in PROMPT_VERSIONS}
+_generated_stats_lock = threading.Lock()
+
+def generated_cache_key(kind: str, *fields: Any) -> str:
+    """Fingerprint of a generation: its kind, prompt version and inputs up to case and whitespace."""
+    normalized = [" ".join(str(field).lower().split()) for field in fields]
+    payload = json.dumps([kind, PROMPT_VERSIONS[kind], normalized])
+    return f"{kind}:" + hashlib.sha256(payload.encode()).hexdigest()
+
+def lookup_generated(kind: str, key: str, regenerate: bool = False) -> Optional[str]:
+    """Returns cached output for `key`, or None on a miss or when `regenerate` skips the cache."""
+    cached = None if regenerate else GENERATED_CACHE.get(key)
+    with _generated_stats_lock:
+        outcome = "regenerated" if regenerate else ("misses" if cached is None else "hits")
+        _generated_stats[kind][outcome] += 1
+    return cached
+
+def store_generated(kind: str, key: str, text: str) -> None:
+    """Caches model output; fallback templates are never stored."""
+    if text.strip():
+        GENERATED_CACHE.set(key, text, ttl=GENERATED_CACHE_TTL[kind])
+
+def generated_cache_stats() -> Dict[str, Any]:
+    with _generated_stats_lock:
+        stats: Dict[str, Any] = {kind: dict(counts) for kind, counts in _generated_stats.items()}
+    stats["store"] = GENERATED_CACHE.stats()
+    return stats
+
+def _cover_letter_cache_key(resume_text: str, job: Dict[str, Any], resume_hash: Optional[str]) -> str:
+    resume_id = resume_hash or hashlib.sha256(resume_text.encode()).hexdigest()
+    return generated_cache_key(
+        "cover_letter", resume_id, job.get('title', ''), job.get('company', ''), str(job.get('description', ''))[:500]
+    )
+
+def _interview_brief_cache_key(company_name: str, job_title: str) -> str:
+    # Briefs depend only on public research, so every candidate shares them
+    return generated_cache_key("interview_brief", company_name, job_title)
 
-    # Fallback jobs with legitimate links
-    print("⚠️ Using fallback jobs")
-    return [
-        {
-            "title": "Software Engineer",
-            "company": "Flipkart",
-            "location": "Bangalore, India",
-            "description": "Join India's leading e-commerce company. Work on scalable systems serving millions of users daily.",
-            "link": "https://www.flipkartcareers.com/"
-        },
-        {
-            "title": "Full Stack Developer",
-            "company": "Razorpay",
-            "location": "Bangalore, India",
-            "description": "Build innovative payment solutions. Work with modern tech stack and fintech products.",
-            "link": "https://razorpay.com/jobs/"
-        },
-        {
-            "title": "Backend Engineer",
-            "company": "Swiggy",
-            "location": "Bangalore, India",
-            "description": "Build real-time systems for food delivery. Work with microservices and high-scale architecture.",
-            "link": "https://careers.swiggy.com/"
-        },
-        {
-            "title": "Data Scientist",
-            "company": "PhonePe",
-            "location": "Bangalore, India",
-            "description": "Work on ML models for fraud detection and recommendations. Analyze payment data at scale.",
-            "link": "https://www.phonepe.com/careers/"
-        },
-        {
-            "title": "ML Engineer",
-            "company": "Ola",
-            "location": "Bangalore, India",
-            "description": "Build ML systems for ride allocation and demand prediction. Work with real-time data.",
-            "link": "https://www.olacabs.com/careers"
-        },
-        {
-            "title": "Frontend Developer",
-            "company": "CRED",
-            "location": "Bangalore, India",
-            "description": "Create premium user experiences. Work with React, animations, and modern design systems.",
-            "link": "https://careers.cred.club/"
-        },
-        {
-            "title": "DevOps Engineer",
-            "company": "Zomato",
-            "location": "Gurugram, India",
-            "description": "Manage cloud infrastructure and deployment pipelines. Work with AWS and Kubernetes.",
-            "link": "https://www.zomato.com/careers"
-        },
-        {
-            "title": "Software Developer",
-            "company": "Freshworks",
-            "location": "Chennai, India",
-            "description": "Build SaaS products used by businesses worldwide. Work on customer engagement platforms.",
-            "link": "https://www.freshworks.com/company/careers/"
-        }
-    ]
 # ============================================
 # AI CONTENT GENERATION
 # ============================================
-def generate_cover_letter(resume_text: str, job: Dict[str, Any]) -> str:
-    """Generates a cover letter using direct Gemini API."""
-    try:
-        import google.generativeai as genai
-        
-        details = extract_resume_details(resume_text)
-        
-        # Safely extract and clean job details
-        job_title = str(job.get('title', 'Position')).strip()
-        company = str(job.get('company', 'Company')).strip()
-        description = str(job.get('description', ''))[:500].strip()
+llm_client.set_rate_limit(GEMINI_REQUESTS_PER_MINUTE, GEMINI_BURST, GEMINI_RATE_LIMIT_WAIT)
+_LLM_POOL = ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY, thread_name_prefix="llm")
 
-        print(f"\n{'='*60}")
-        print(f"Generating cover letter for: {company} - {job_title}")
-        print(f"{'='*60}\n")
+def warm_up_llm(background: bool = True):
+    """Loads the Gemini SDK and model handle before the first request needs them."""
+    return llm_client.warm_up(GEMINI_MODEL, GEMINI_API_KEY, background)
 
-        # Configure Gemini API directly
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        prompt = f"""Write a professional cover letter for this job application:
+def _cover_letter_prompt(resume_text: str, job: Dict[str, Any], details: Dict[str, Optional[str]]) -> str:
+    """Builds the Gemini prompt for a cover letter."""
+    # Safely extract and clean job details
+    job_title = str(job.get('title', 'Position')).strip()
+    company = str(job.get('company', 'Company')).strip()
+    description = str(job.get('description', ''))[:500].strip()
+
+    return f"""Write a professional cover letter for this job application:
 
 Position: {job_title}
 Company: {company}
@@ -355,21 +1166,10 @@ Write a concise 3-paragraph cover letter that:
 3. Closes with a strong call to action
 
 Keep it professional, personable, and under 300 words."""
-        
-        response = model.generate_content(prompt)
-        letter = response.text
-        
-        print(f"✓ Cover letter generated successfully ({len(letter)} characters)\n")
-        return letter
-        
-    except Exception as e:
-        print(f"✗ Error generating cover letter: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        
-        # Return fallback template
-        details = extract_resume_details(resume_text)
-        return f"""Dear Hiring Manager,
+
+def _cover_letter_template(job: Dict[str, Any], details: Dict[str, Optional[str]]) -> str:
+    """Fallback cover letter used when generation fails."""
+    return f"""Dear Hiring Manager,
 
 I am excited to apply for the {job.get('title', 'position')} position at {job.get('company', 'your company')}. With my relevant background and skills, I am confident I would be a valuable addition to your team.
 
@@ -382,46 +1182,195 @@ Best regards,
 {details.get('email', '')}
 {details.get('phone', '')}"""
 
+def generate_cover_letter(resume_text: str, job: Dict[str, Any], resume_hash: Optional[str] = None,
+                          regenerate: bool = False, details: Optional[Dict[str, Optional[str]]] = None) -> str:
+    """Generates a cover letter using direct Gemini API.
+
+    Letters are cached per resume and job; `regenerate` skips the cached one.
+    Pass `details` to reuse contact details already extracted from the resume.
+    """
+    key = _cover_letter_cache_key(resume_text, job, resume_hash)
+    cached = lookup_generated("cover_letter", key, regenerate)
+    if cached is not None:
+        print(f"✓ Cover letter served from cache: {job.get('company', 'Company')} - {job.get('title', 'Position')}")
+        return cached
+
+    details = details or extract_resume_details(resume_text)
+    try:
+        print(f"\n{'='*60}")
+        print(f"Generating cover letter for: {job.get('company', 'Company')} - {job.get('title', 'Position')}")
+        print(f"{'='*60}\n")
+
+        letter = llm_client.generate_text(_cover_letter_prompt(resume_text, job, details), GEMINI_MODEL, GEMINI_API_KEY)
+        
+        print(f"✓ Cover letter generated successfully ({len(letter)} characters)\n")
+        store_generated("cover_letter", key, letter)
+        return letter
+        
+    except Exception as e:
+        print(f"✗ Error generating cover letter: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        
+        # Return fallback template
+        return _cover_letter_template(job, details)
+
+def stream_cover_letter(resume_text: str, job: Dict[str, Any], resume_hash: Optional[str] = None,
+                        regenerate: bool = False) -> Iterator[Tuple[str, str]]:
+    """Streams a cover letter as ("chunk", text) events while Gemini writes it.
+
+    If generation fails or produces nothing, a single ("fallback", template)
+    event carries the complete template letter instead; it replaces anything
+    streamed before it. A cached letter arrives as one chunk.
+    """
+    key = _cover_letter_cache_key(resume_text, job, resume_hash)
+    cached = lookup_generated("cover_letter", key, regenerate)
+    if cached is not None:
+        yield "chunk", cached
+        return
+
+    details = extract_resume_details(resume_text)
+    parts: List[str] = []
+    try:
+        print(f"Streaming cover letter for: {job.get('company', 'Company')} - {job.get('title', 'Position')}")
+        for text in llm_client.stream_text(_cover_letter_prompt(resume_text, job, details), GEMINI_MODEL, GEMINI_API_KEY):
+            parts.append(text)
+            yield "chunk", text
+        if parts:
+            letter = "".join(parts)
+            print(f"✓ Cover letter streamed ({len(letter)} characters)")
+            store_generated("cover_letter", key, letter)
+            return
+        print("✗ Cover letter stream was empty")
+    except Exception as e:
+        print(f"✗ Error streaming cover letter: {str(e)}")
+
+    yield "fallback", _cover_letter_template(job, details)
+
+def generate_cover_letters(resume_text: str, jobs: List[Dict[str, Any]], resume_hash: Optional[str] = None,
+                           regenerate: bool = False, timeout: float = COVER_LETTER_BATCH_TIMEOUT) -> Iterator[Tuple[int, str]]:
+    """Generates letters for several jobs concurrently, yielding (job index, letter) as each finishes.
+
+    Resume details are extracted once for the whole batch. Generation runs on the
+    shared LLM pool under the Gemini rate limit; letters that fail or miss the
+    deadline come back as the fallback template.
+    """
+    details = extract_resume_details(resume_text)
+    calls: Dict[str, Callable[[], Any]] = {
+        str(index): (lambda job=job: generate_cover_letter(resume_text, job, resume_hash, regenerate, details))
+        for index, job in enumerate(jobs[:COVER_LETTER_BATCH_MAX])
+    }
+    for name, letter in iter_concurrently(calls, timeout, default_factory=lambda: None, pool=_LLM_POOL):
+        index = int(name)
+        yield index, letter or _cover_letter_template(jobs[index], details)
+
 # ============================================
 # SKILL DEVELOPMENT
 # ============================================
+def _resume_skill_ids(resume_skills: List[str]) -> Dict[str, str]:
+    """Maps each resume skill's canonical id to the resume's own spelling of it, for display."""
+    ids: Dict[str, str] = {}
+    for skill in resume_skills:
+        ids.setdefault(TAXONOMY.canonical(skill) or skill.lower(), skill)
+    return ids
+
 def analyze_skill_gap(resume_skills: List[str], job_description: str) -> Dict[str, List[str]]:
     """Compares resume skills with job requirements."""
-    all_skills = {
-        "python", "java", "c++", "javascript", "typescript", "go", "rust", "c#", "php", "ruby",
-        "sql", "nosql", "mongodb", "postgresql", "mysql", "redis", "cassandra", "dynamodb",
-        "ai", "ml", "machine learning", "deep learning", "nlp", "computer vision", 
-        "pytorch", "tensorflow", "keras", "scikit-learn", "neural networks",
-        "aws", "gcp", "azure", "docker", "kubernetes", "jenkins", "terraform", "ansible",
-        "react", "angular", "vue", "node", "express", "django", "flask", "spring", "fastapi",
-        "git", "ci/cd", "agile", "scrum", "devops", "tdd", "rest api", "graphql", "microservices",
-        "spark", "hadoop", "kafka", "elasticsearch", "etl", "data engineering",
-        "data analysis", "statistics", "data visualization", "tableau", "power bi", "big data",
-        "unity", "game development", "mobile development", "swift", "kotlin", "react native",
-        "html", "css", "web development", "frontend", "backend", "full stack",
-        "data science", "git", "ci/cd", "agile", "scrum", "devops", "tdd", "rest api", "graphql", "microservices",
-        "unreal engine", "augmented reality", "virtual reality"
-    }
-    
-    job_lower = job_description.lower()
-    resume_skills_lower = {skill.lower() for skill in resume_skills}
-    
-    required_skills = {skill.title() for skill in all_skills if skill in job_lower}
-    missing_skills = list(required_skills - {skill.title() for skill in resume_skills_lower})
+    resume_skill_ids = {TAXONOMY.canonical(skill) or skill.lower() for skill in resume_skills}
+
+    required_skills = [skill for skill in TAXONOMY.matcher.find_skills(job_description) if skill in TAXONOMY.gap_skills]
+    missing_skills = [format_skill(skill) for skill in required_skills if skill not in resume_skill_ids]
     
     return {"missing_skills": missing_skills[:10], "matched_skills": resume_skills}
 
-def get_course_recommendations(skills: List[str]) -> List[Dict[str, Any]]:
-    """Fetches course recommendations for a list of skills."""
+def analyze_skill_gaps(resume_skills: List[str], job_descriptions: List[str], top: int = 10) -> Dict[str, Any]:
+    """Skill-gap analysis over many job descriptions at once.
+
+    Each description is scanned once by the skill matcher. The skills found form
+    a sparse skills x jobs presence matrix (skill -> indices of the jobs asking
+    for it), from which the per-job results and the most common gaps are read.
+    """
+    resume_ids = _resume_skill_ids(resume_skills)
+    presence: Dict[str, List[int]] = {}
+    required_by_job: List[List[str]] = []
+    for index, description in enumerate(job_descriptions):
+        required = [skill for skill in TAXONOMY.matcher.find_skills(description) if skill in TAXONOMY.gap_skills]
+        required_by_job.append(required)
+        for skill in required:
+            presence.setdefault(skill, []).append(index)
+
+    jobs = []
+    for required in required_by_job:
+        matched = [resume_ids[skill] for skill in required if skill in resume_ids]
+        jobs.append({
+            "matched_skills": matched,
+            "missing_skills": [format_skill(skill) for skill in required if skill not in resume_ids],
+            "match_percent": round(100 * len(matched) / len(required), 1) if required else None
+        })
+
+    # Most common gaps first; ties keep the order skills were first seen in
+    gaps = sorted(((skill, len(indices)) for skill, indices in presence.items() if skill not in resume_ids),
+                  key=lambda item: -item[1])
+    scored = [job["match_percent"] for job in jobs if job["match_percent"] is not None]
+    return {
+        "jobs": jobs,
+        "top_missing_skills": [
+            {"skill": format_skill(skill), "jobs": count, "share": round(100 * count / len(jobs), 1)}
+            for skill, count in gaps[:top]
+        ],
+        "matched_skills": [resume_ids[skill] for skill in presence if skill in resume_ids],
+        "average_match_percent": round(sum(scored) / len(scored), 1) if scored else None
+    }
+
+# YouTube lookups queue on their own small pool rather than holding shared outbound workers
+_YOUTUBE_POOL = ThreadPoolExecutor(max_workers=YOUTUBE_MAX_CONCURRENCY, thread_name_prefix="youtube")
+
+def get_course_recommendations(skills: List[str], timeout: float = COURSE_LOOKUP_TIMEOUT) -> List[Dict[str, Any]]:
+    """Fetches course recommendations for a list of skills.
+
+    YouTube lookups run in parallel; skills whose lookup misses the deadline
+    get only their curated courses.
+    """
+    skills = list(dict.fromkeys(skills))[:5]
+    youtube = run_concurrently(
+        {skill: (lambda s=skill: search_youtube_courses(s)) for skill in skills},
+        timeout,
+        pool=_YOUTUBE_POOL
+    )
     return [
         {
             "skill": skill,
-            "youtube": search_youtube_courses(skill),
+            "youtube": youtube[skill],
             "curated": get_curated_courses(skill)
         }
-        for skill in skills[:5]
+        for skill in skills
     ]
 
+def stream_course_recommendations(skills: List[str], timeout: float = COURSE_LOOKUP_TIMEOUT) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Course recommendations as events: curated courses at once, YouTube results as each lookup resolves.
+
+    Yields one ("courses", {"courses"}) event in the shape of get_course_recommendations
+    with empty YouTube lists, then ("youtube", {"skill", "youtube"}) per skill.
+    """
+    skills = list(dict.fromkeys(skills))[:5]
+    yield "courses", {"courses": [{"skill": skill, "youtube": [], "curated": get_curated_courses(skill)} for skill in skills]}
+
+    calls: Dict[str, Callable[[], Any]] = {skill: (lambda s=skill: search_youtube_courses(s)) for skill in skills}
+    for skill, videos in iter_concurrently(calls, timeout, pool=_YOUTUBE_POOL):
+        yield "youtube", {"skill": skill, "youtube": videos}
+
+def stream_skill_gap_and_courses(resume_skills: List[str], job_description: str,
+                                 timeout: float = COURSE_LOOKUP_TIMEOUT) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Gap analysis followed by courses for the missing skills, in one pipeline.
+
+    Yields ("analysis", {"analysis"}) first, then the stream_course_recommendations
+    events when anything is missing.
+    """
+    analysis = analyze_skill_gap(resume_skills, job_description)
+    yield "analysis", {"analysis": analysis}
+    if analysis["missing_skills"]:
+        yield from stream_course_recommendations(analysis["missing_skills"], timeout)
+
 def search_youtube_courses(skill: str, max_results: int = 3) -> List[Dict[str, str]]:
     """Searches YouTube for relevant educational videos."""
     params = {
@@ -434,9 +1383,7 @@ def search_youtube_courses(skill: str, max_results: int = 3) -> List[Dict[str, s
     }
     
     try:
-        response = requests.get(YOUTUBE_API_URL, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = fetch_json(YOUTUBE_API_URL, params, timeout=10, cache_ttl=SEARCH_CACHE_TTL["youtube"])
         
         return [
             {
@@ -452,122 +1399,47 @@ def search_youtube_courses(skill: str, max_results: int = 3) -> List[Dict[str, s
 
 def get_curated_courses(skill: str) -> List[Dict[str, str]]:
     """Provides curated courses for common skills."""
-    courses_db = {
-        "python": [
-            {"title": "Python for Everybody (Coursera)", "url": "https://www.coursera.org/specializations/python", "platform": "Coursera"},
-            {"title": "Complete Python Bootcamp (Udemy)", "url": "https://www.udemy.com/course/complete-python-bootcamp/", "platform": "Udemy"}
-        ],
-        "java": [
-            {"title": "Java Programming Masterclass (Udemy)", "url": "https://www.udemy.com/course/java-the-complete-java-developer-course/", "platform": "Udemy"},
-            {"title": "Object Oriented Java Programming (Coursera)", "url": "https://www.coursera.org/learn/object-oriented-java", "platform": "Coursera"}
-        ],
-        "javascript": [
-            {"title": "JavaScript - The Complete Guide (Udemy)", "url": "https://www.udemy.com/course/javascript-the-complete-guide-2020-beginner-advanced/", "platform": "Udemy"},
-            {"title": "Modern JavaScript (freeCodeCamp)", "url": "https://www.freecodecamp.org/learn/javascript-algorithms-and-data-structures/", "platform": "freeCodeCamp"}
-        ],
-        "machine learning": [
-            {"title": "Machine Learning by Andrew Ng", "url": "https://www.coursera.org/learn/machine-learning", "platform": "Coursera"},
-            {"title": "Fast.ai Practical Deep Learning", "url": "https://course.fast.ai/", "platform": "Fast.ai"}
-        ],
-        "deep learning": [
-            {"title": "Deep Learning Specialization", "url": "https://www.coursera.org/specializations/deep-learning", "platform": "Coursera"},
-            {"title": "Practical Deep Learning for Coders", "url": "https://course.fast.ai/", "platform": "Fast.ai"}
-        ],
-        "pytorch": [
-            {"title": "PyTorch for Deep Learning (Udacity)", "url": "https://www.udacity.com/course/deep-learning-pytorch--ud188", "platform": "Udacity"},
-            {"title": "PyTorch Official Tutorials", "url": "https://pytorch.org/tutorials/", "platform": "PyTorch"}
-        ],
-        "tensorflow": [
-            {"title": "TensorFlow Developer Certificate", "url": "https://www.coursera.org/professional-certificates/tensorflow-in-practice", "platform": "Coursera"},
-            {"title": "TensorFlow 2.0 Complete Course", "url": "https://www.freecodecamp.org/news/massive-tensorflow-2-0-free-course/", "platform": "freeCodeCamp"}
-        ],
-        "aws": [
-            {"title": "AWS Cloud Practitioner Essentials", "url": "https://www.coursera.org/learn/aws-cloud-practitioner-essentials", "platform": "Coursera"},
-            {"title": "AWS Certified Solutions Architect", "url": "https://www.udemy.com/course/aws-certified-solutions-architect-associate/", "platform": "Udemy"}
-        ],
-        "docker": [
-            {"title": "Docker for Beginners", "url": "https://www.udemy.com/course/docker-tutorial-for-devops-run-docker-containers/", "platform": "Udemy"},
-            {"title": "Docker Official Documentation", "url": "https://docs.docker.com/get-started/", "platform": "Docker"}
-        ],
-        "kubernetes": [
-            {"title": "Kubernetes for Beginners (Udemy)", "url": "https://www.udemy.com/course/learn-kubernetes/", "platform": "Udemy"},
-            {"title": "Kubernetes Official Tutorials", "url": "https://kubernetes.io/docs/tutorials/", "platform": "Kubernetes"}
-        ],
-        "react": [
-            {"title": "React - The Complete Guide (Udemy)", "url": "https://www.udemy.com/course/react-the-complete-guide-incl-redux/", "platform": "Udemy"},
-            {"title": "React Official Tutorial", "url": "https://react.dev/learn", "platform": "React"}
-        ],
-        "angular": [
-            {"title": "Angular - The Complete Guide (Udemy)", "url": "https://www.udemy.com/course/the-complete-guide-to-angular-2/", "platform": "Udemy"},
-            {"title": "Angular Official Tutorial", "url": "https://angular.io/tutorial", "platform": "Angular"}
-        ],
-        "node": [
-            {"title": "Node.js - The Complete Guide (Udemy)", "url": "https://www.udemy.com/course/nodejs-the-complete-guide/", "platform": "Udemy"},
-            {"title": "Node.js Official Guides", "url": "https://nodejs.org/en/docs/guides/", "platform": "Node.js"}
-        ],
-        "sql": [
-            {"title": "The Complete SQL Bootcamp (Udemy)", "url": "https://www.udemy.com/course/the-complete-sql-bootcamp/", "platform": "Udemy"},
-            {"title": "SQL for Data Science (Coursera)", "url": "https://www.coursera.org/learn/sql-for-data-science", "platform": "Coursera"}
-        ],
-        "data science": [
-            {"title": "Data Science Specialization (Coursera)", "url": "https://www.coursera.org/specializations/jhu-data-science", "platform": "Coursera"},
-            {"title": "Python for Data Science (Udemy)", "url": "https://www.udemy.com/course/python-for-data-science-and-machine-learning-bootcamp/", "platform": "Udemy"}
-        ],
-        "git": [
-            {"title": "Git Complete: The Definitive Guide (Udemy)", "url": "https://www.udemy.com/course/git-complete/", "platform": "Udemy"},
-            {"title": "Git Official Documentation", "url": "https://git-scm.com/doc", "platform": "Git"}
-        ]
-    }
-    
-    skill_lower = skill.lower()
-    for key in courses_db:
-        if key in skill_lower or skill_lower in key:
-            return courses_db[key]
+    courses = TAXONOMY.courses_for(skill)
+    if courses:
+        return courses
     
     return [{"title": f"{skill} Fundamentals", "url": f"https://www.google.com/search?q={skill}+course", "platform": "Search"}]
 
 # ============================================
 # INTERVIEW PREPARATION
 # ============================================
-def search_company_info(company_name: str) -> Dict[str, List[Dict[str, str]]]:
-    """Gathers information about a company from various sources."""
-    queries = {
-        "news": f"{company_name} recent news 2024 2025",
-        "culture": f"{company_name} work culture employee reviews glassdoor",
-        "hiring": f"{company_name} hiring trends layoffs expansion",
-        "overview": f"{company_name} company profile about mission values"
+COMPANY_INFO_QUERIES = {
+    "news": "{company_name} recent news 2024 2025",
+    "culture": "{company_name} work culture employee reviews glassdoor",
+    "hiring": "{company_name} hiring trends layoffs expansion",
+    "overview": "{company_name} company profile about mission values"
+}
+
+def search_company_category(company_name: str, category: str) -> List[Dict[str, str]]:
+    """Fetches one category of company information (news, culture, hiring or overview)."""
+    params = {
+        "engine": "google",
+        "q": COMPANY_INFO_QUERIES[category].format(company_name=company_name),
+        "api_key": SERPAPI_KEY,
+        "num": 5,
+        "gl": "in",
+        "hl": "en"
     }
     
-    results: Dict[str, List[Dict[str, str]]] = {}
-    
-    for category, query in queries.items():
-        params = {
-            "engine": "google",
-            "q": query,
-            "api_key": SERPAPI_KEY,
-            "num": 5,
-            "gl": "in",
-            "hl": "en"
-        }
+    try:
+        data = fetch_json(SERPAPI_URL, params, timeout=15, cache_ttl=SEARCH_CACHE_TTL["company_news" if category == "news" else "company"])
         
-        try:
-            response = requests.get(SERPAPI_URL, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            
-            results[category] = [
-                {
-                    "title": item.get("title", ""),
-                    "snippet": item.get("snippet", ""),
-                    "link": item.get("link", "")
-                }
-                for item in data.get("organic_results", [])[:3]
-            ]
-        except requests.RequestException as e:
-            print(f"Error fetching {category} for {company_name}: {e}")
-            results[category] = []
-                
-    return results
+        return [
+            {
+                "title": item.get("title", ""),
+                "snippet": item.get("snippet", ""),
+                "link": item.get("link", "")
+            }
+            for item in data.get("organic_results", [])[:3]
+        ]
+    except requests.RequestException as e:
+        print(f"Error fetching {category} for {company_name}: {e}")
+        return []
 
 def get_common_interview_questions(job_title: str, company_name: str) -> List[Dict[str, str]]:
     """Finds common interview questions for a specific role and company."""
@@ -582,9 +1454,7 @@ def get_common_interview_questions(job_title: str, company_name: str) -> List[Di
     }
     
     try:
-        response = requests.get(SERPAPI_URL, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        data = fetch_json(SERPAPI_URL, params, timeout=15, cache_ttl=SEARCH_CACHE_TTL["interview_questions"])
         
         return [
             {
@@ -598,24 +1468,39 @@ def get_common_interview_questions(job_title: str, company_name: str) -> List[Di
         print(f"Error fetching interview questions: {e}")
         return []
 
-def generate_interview_brief(company_name: str, job_title: str, company_info: Dict[str, Any], interview_questions: List[Dict[str, str]]) -> str:
-    """Generates a comprehensive interview brief using Gemini AI."""
-    try:
-        import google.generativeai as genai
-        
-        def format_items(items: List[Dict[str, str]]) -> str:
-            """Helper to format list of items."""
-            if not items:
-                return "No information found"
-            return "\n".join(f"- {item.get('title', 'N/A')}: {item.get('snippet', 'N/A')[:200]}" for item in items)
-
-        news_summary = format_items(company_info.get('news', []))
-        culture_summary = format_items(company_info.get('culture', []))
-        hiring_summary = format_items(company_info.get('hiring', []))
-        overview_summary = format_items(company_info.get('overview', []))
-        questions_summary = format_items(interview_questions)
-
-        prompt = f"""Create a comprehensive interview preparation brief for:
+def generate_interview_brief(company_name: str, job_title: str, company_info: Dict[str, Any],
+                             interview_questions: List[Dict[str, str]], regenerate: bool = False) -> str:
+    """Generates a comprehensive interview brief, sharing one generation between identical concurrent requests.
+
+    Briefs are cached per (company, job title); `regenerate` skips the cached one.
+    """
+    key = _interview_brief_cache_key(company_name, job_title)
+    cached = lookup_generated("interview_brief", key, regenerate)
+    if cached is not None:
+        return cached
+    return SINGLE_FLIGHT.do(key, lambda: _generate_interview_brief(key, company_name, job_title, company_info, interview_questions))
+
+def _format_research_items(items: List[Dict[str, str]]) -> str:
+    """Helper to format list of items."""
+    if not items:
+        return "No information found"
+    return "\n".join(f"- {item.get('title', 'N/A')}: {item.get('snippet', 'N/A')[:200]}" for item in items)
+
+def _research_summaries(company_info: Dict[str, Any], interview_questions: List[Dict[str, str]]) -> Tuple[str, str, str, str, str]:
+    """Formats (news, culture, hiring, overview, questions) research summaries."""
+    return (
+        _format_research_items(company_info.get('news', [])),
+        _format_research_items(company_info.get('culture', [])),
+        _format_research_items(company_info.get('hiring', [])),
+        _format_research_items(company_info.get('overview', [])),
+        _format_research_items(interview_questions)
+    )
+
+def _interview_brief_prompt(company_name: str, job_title: str, company_info: Dict[str, Any], interview_questions: List[Dict[str, str]]) -> str:
+    """Builds the Gemini prompt for an interview brief."""
+    news_summary, culture_summary, hiring_summary, overview_summary, questions_summary = _research_summaries(company_info, interview_questions)
+
+    return f"""Create a comprehensive interview preparation brief for:
 
 Company: {company_name}
 Position: {job_title}
@@ -655,20 +1540,12 @@ Please provide a structured interview preparation guide with:
 6. **Smart Questions to Ask** (5 intelligent questions based on company research)
 
 Keep it professional, actionable, and well-structured."""
-        
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
-        
-        return response.text
-        
-    except Exception as e:
-        print(f"Error generating interview brief: {e}")
-        import traceback
-        traceback.print_exc()
-        
-        # Better fallback with actual data
-        return f"""# Interview Preparation Brief
+
+def _interview_brief_template(company_name: str, job_title: str, company_info: Dict[str, Any], interview_questions: List[Dict[str, str]]) -> str:
+    """Fallback brief built from the raw research when generation fails."""
+    news_summary, culture_summary, hiring_summary, overview_summary, questions_summary = _research_summaries(company_info, interview_questions)
+
+    return f"""# Interview Preparation Brief
 
 ## Company: {company_name}
 ## Position: {job_title}
@@ -788,18 +1665,100 @@ Keep it professional, actionable, and well-structured."""
 **Good luck with your interview at {company_name}!** 🚀
 """
 
-def research_company_for_interview(company_name: str, job_title: str) -> Dict[str, Any]:
+def _generate_interview_brief(key: str, company_name: str, job_title: str, company_info: Dict[str, Any], interview_questions: List[Dict[str, str]]) -> str:
+    """Generates a comprehensive interview brief using Gemini AI."""
+    try:
+        prompt = _interview_brief_prompt(company_name, job_title, company_info, interview_questions)
+        brief = llm_client.generate_text(prompt, GEMINI_MODEL, GEMINI_API_KEY)
+        store_generated("interview_brief", key, brief)
+        return brief
+        
+    except Exception as e:
+        print(f"Error generating interview brief: {e}")
+        import traceback
+        traceback.print_exc()
+        
+        # Better fallback with actual data
+        return _interview_brief_template(company_name, job_title, company_info, interview_questions)
+
+def stream_interview_brief(company_name: str, job_title: str, company_info: Dict[str, Any],
+                           interview_questions: List[Dict[str, str]], regenerate: bool = False) -> Iterator[Tuple[str, str]]:
+    """Streams an interview brief as ("chunk", text) events while Gemini writes it.
+
+    On failure a single ("fallback", template) event replaces anything streamed
+    before it. A cached brief arrives as one chunk.
+    """
+    key = _interview_brief_cache_key(company_name, job_title)
+    cached = lookup_generated("interview_brief", key, regenerate)
+    if cached is not None:
+        yield "chunk", cached
+        return
+
+    parts: List[str] = []
+    try:
+        prompt = _interview_brief_prompt(company_name, job_title, company_info, interview_questions)
+        for text in llm_client.stream_text(prompt, GEMINI_MODEL, GEMINI_API_KEY):
+            parts.append(text)
+            yield "chunk", text
+        if parts:
+            store_generated("interview_brief", key, "".join(parts))
+            return
+        print("Interview brief stream was empty")
+    except Exception as e:
+        print(f"Error streaming interview brief: {e}")
+
+    yield "fallback", _interview_brief_template(company_name, job_title, company_info, interview_questions)
+
+def _research_calls(company_name: str, job_title: str) -> Dict[str, Callable[[], Any]]:
+    """The company lookups, one per COMPANY_INFO_QUERIES category, plus the interview question search."""
+    calls: Dict[str, Callable[[], Any]] = {
+        category: (lambda c=category: search_company_category(company_name, c)) for category in COMPANY_INFO_QUERIES
+    }
+    calls["interview_questions"] = lambda: get_common_interview_questions(job_title, company_name)
+    return calls
+
+def gather_company_research(company_name: str, job_title: str, timeout: float = RESEARCH_TIMEOUT) -> Tuple[Dict[str, List[Dict[str, str]]], List[Dict[str, str]]]:
+    """Runs the four company lookups and the interview question search concurrently.
+
+    Whatever has finished by the deadline is returned; the rest come back empty.
+    """
+    results = run_concurrently(_research_calls(company_name, job_title), timeout)
+    interview_questions = results.pop("interview_questions")
+    return results, interview_questions
+
+def stream_company_research(company_name: str, job_title: str, timeout: float = RESEARCH_TIMEOUT,
+                            regenerate: bool = False) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Research pipeline that yields each stage as soon as it is ready.
+
+    Events, in order of arrival:
+    - ("company_info", {"category", "items"}) once per category
+    - ("interview_questions", {"items"})
+    - ("brief_chunk", {"text"}) while the brief is generated, or one
+      ("brief_fallback", {"text"}) with the template brief if generation fails
+    """
+    print(f"Streaming research for {company_name} ({job_title})...")
+    company_info: Dict[str, List[Dict[str, str]]] = {}
+    interview_questions: List[Dict[str, str]] = []
+    for name, items in iter_concurrently(_research_calls(company_name, job_title), timeout):
+        if name == "interview_questions":
+            interview_questions = items
+            yield "interview_questions", {"items": items}
+        else:
+            company_info[name] = items
+            yield "company_info", {"category": name, "items": items}
+    
+    company_info = {category: company_info[category] for category in COMPANY_INFO_QUERIES}
+    for event, text in stream_interview_brief(company_name, job_title, company_info, interview_questions, regenerate):
+        yield ("brief_chunk" if event == "chunk" else "brief_fallback"), {"text": text}
+
+def research_company_for_interview(company_name: str, job_title: str, regenerate: bool = False) -> Dict[str, Any]:
     """Complete company research pipeline for interview preparation."""
     print(f"Researching {company_name} for {job_title} position...")
     
-    # Fetch company information
-    company_info = search_company_info(company_name)
-    
-    # Fetch common interview questions
-    interview_questions = get_common_interview_questions(job_title, company_name)
+    company_info, interview_questions = gather_company_research(company_name, job_title)
     
     # Generate AI brief
-    ai_brief = generate_interview_brief(company_name, job_title, company_info, interview_questions)
+    ai_brief = generate_interview_brief(company_name, job_title, company_info, interview_questions, regenerate)
     
     return {
         "company_name": company_name,
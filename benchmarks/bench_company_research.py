@@ -0,0 +1,71 @@
+"""
+Benchmark: company research lookups, serial (previous behaviour) vs concurrent fan-out,
+against a local fake SerpAPI that injects a fixed latency per query type.
+
+Run from the project root:
+    python benchmarks/bench_company_research.py
+"""
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend  # noqa: E402
+
+# Seconds of latency injected per query, keyed by a word unique to each query
+LATENCY = {"news": 0.4, "culture": 0.7, "hiring": 0.3, "profile": 0.5, "interview": 0.9}
+ROUNDS = 3
+
+
+class FakeSerpAPI(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query).get("q", [""])[0]
+        time.sleep(next((delay for word, delay in LATENCY.items() if word in query), 0.1))
+        body = json.dumps({"organic_results": [
+            {"title": f"Result {i} for {query}", "snippet": "Lorem ipsum", "link": f"https://example.com/{i}"}
+            for i in range(5)
+        ]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serial_research(company_name, job_title):
+    company_info = {category: backend.search_company_category(company_name, category)
+                    for category in backend.COMPANY_INFO_QUERIES}
+    return company_info, backend.get_common_interview_questions(job_title, company_name)
+
+
+def timed(func):
+    # Every run must reach the fake API, not the response cache filled by the previous one
+    backend.SEARCH_CACHE.clear()
+    start = time.perf_counter()
+    company_info, questions = func("Flipkart", "Software Engineer")
+    assert all(company_info.values()) and questions
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeSerpAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    backend.SERPAPI_URL = f"http://127.0.0.1:{server.server_port}/search"
+
+    print(f"Injected latency: {LATENCY}")
+    print(f"sum = {sum(LATENCY.values()):.2f}s, max = {max(LATENCY.values()):.2f}s")
+    for name, func in [("serial", serial_research), ("concurrent", backend.gather_company_research)]:
+        best = min(timed(func) for _ in range(ROUNDS))
+        print(f"{name:>10}: {best:.2f}s")
+
+    server.shutdown()
@@ -0,0 +1,66 @@
+"""
+Benchmark: dedupe_jobs time as the candidate batch grows, with a third of the
+jobs re-posted under tracking links or lightly edited descriptions.
+
+Run from the project root:
+    python benchmarks/bench_job_dedup.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend  # noqa: E402
+
+BATCH_SIZES = [24, 100, 500, 2000]
+ROUNDS = 3
+
+WORDS = (
+    "Python AWS Docker Kubernetes React Java Spring SQL PostgreSQL Kafka Spark TypeScript machine learning "
+    "team build scalable systems design APIs microservices frontend backend pipelines agile customers "
+    "ownership mentoring production reliability latency dashboards stakeholders"
+).split()
+TITLES = ["Backend Engineer", "Data Engineer", "Frontend Developer", "ML Engineer", "DevOps Engineer"]
+
+
+def make_jobs(count, seed=7):
+    rng = random.Random(seed)
+    originals = [
+        {
+            "title": rng.choice(TITLES),
+            "company": f"Company {i} Pvt. Ltd.",
+            "location": "Bangalore, India",
+            "description": " ".join(rng.choice(WORDS) for _ in range(45)),
+            "link": f"https://example.com/jobs/{i}",
+        }
+        for i in range(count - count // 3)
+    ]
+    reposts = []
+    for job in rng.sample(originals, count // 3):
+        words = job["description"].split()
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+        reposts.append(dict(job, company="Unknown Company", description=" ".join(words),
+                            link=f"https://mirror.example.org/{rng.randrange(10**6)}?utm_source=feed"))
+    jobs = originals + reposts
+    rng.shuffle(jobs)
+    return jobs, len(originals)
+
+
+def best_of(func):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    print(f"{'jobs':>6} {'unique':>7} {'kept':>6} {'ms':>8} {'us/job':>8}")
+    for size in BATCH_SIZES:
+        jobs, unique = make_jobs(size)
+        kept = len(backend.dedupe_jobs(jobs))
+        elapsed = best_of(lambda: backend.dedupe_jobs(jobs))
+        print(f"{size:>6} {unique:>7} {kept:>6} {elapsed * 1000:>8.1f} {elapsed / size * 1e6:>8.0f}")
@@ -0,0 +1,67 @@
+"""
+Benchmark: rank_jobs time per job as the candidate batch grows, and the
+sparse (NumPy/SciPy) scorer against the pure-Python fallback on the same features.
+
+Run from the project root:
+    python benchmarks/bench_job_ranking.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend  # noqa: E402
+import ranking  # noqa: E402
+
+BATCH_SIZES = [24, 100, 1000, 5000]
+ROUNDS = 3
+
+WORDS = (
+    "Python AWS Docker Kubernetes React Java Spring SQL PostgreSQL Kafka Spark TypeScript machine learning "
+    "team build scalable systems design APIs microservices frontend backend pipelines agile customers "
+    "ownership mentoring production reliability latency dashboards stakeholders"
+).split()
+TITLES = ["Backend Engineer", "Data Engineer", "Frontend Developer", "ML Engineer", "DevOps Engineer"]
+RESUME_SKILLS = ["Python", "AWS", "Docker", "Kubernetes", "PostgreSQL", "Kafka"]
+RESUME_TEXT = (
+    "Software engineer with five years of experience building Python microservices on AWS, "
+    "containerised with Docker and Kubernetes, backed by PostgreSQL and Kafka. "
+) * 4
+
+
+def make_jobs(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "title": rng.choice(TITLES),
+            "company": f"Company {i}",
+            "location": "Bangalore, India",
+            "description": " ".join(rng.choice(WORDS) for _ in range(45)),
+            "link": f"https://example.com/jobs/{i}",
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(func):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    query = ranking.features(RESUME_TEXT, [skill.lower() for skill in RESUME_SKILLS])
+    print(f"{'jobs':>6} {'rank_jobs ms':>13} {'us/job':>8} {'sparse ms':>10} {'python ms':>10}")
+    for size in BATCH_SIZES:
+        jobs = make_jobs(size)
+        docs = [ranking.features(f"{job['title']} {job['description']}", []) for job in jobs]
+
+        total = best_of(lambda: backend.rank_jobs(jobs, RESUME_SKILLS, RESUME_TEXT, limit=8))
+        sparse = best_of(lambda: ranking.score_documents(query, docs))
+        python = best_of(lambda: ranking._score_python(query, docs))
+        print(f"{size:>6} {total * 1000:>13.1f} {total / size * 1e6:>8.0f} {sparse * 1000:>10.2f} {python * 1000:>10.2f}")
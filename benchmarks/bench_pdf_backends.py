@@ -0,0 +1,97 @@
+"""
+Benchmark: pages/sec and peak RSS of each PDF text backend on generated resumes.
+
+Each backend runs in its own subprocess so peak RSS is not shared between them.
+Run from the project root:
+    python benchmarks/bench_pdf_backends.py
+"""
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PAGE_COUNTS = [1, 2, 5, 20]
+COPIES = 5  # resumes per page count
+LINES_PER_PAGE = 48
+
+WORDS = (
+    "Python AWS Docker Kubernetes React machine learning led team delivered platform improved "
+    "latency reduced cost designed built microservices mentored engineers SQL PostgreSQL Kafka "
+    "Spark pipelines dashboards stakeholders agile scrum CI/CD Terraform Linux TypeScript"
+).split()
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_resume_pdf(pages, seed):
+    """Writes a minimal multi-page Helvetica PDF and returns its bytes."""
+    rng = random.Random(seed)
+    objects = [b"<</Type/Catalog/Pages 2 0 R>>", None, b"<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>"]
+    kids = []
+    for _ in range(pages):
+        lines = [" ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(LINES_PER_PAGE)]
+        stream = "BT /F1 10 Tf 50 770 Td 14 TL " + " ".join(f"({_escape(line)}) '" for line in lines) + " ET"
+        stream = stream.encode("latin-1")
+        objects.append(b"<</Length %d>>stream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]/Contents %d 0 R/Resources<</Font<</F1 3 0 R>>>>>>"
+            % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<</Type/Pages/Kids[%s]/Count %d>>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer<</Size %d/Root 1 0 R>>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def run_backend(backend, corpus_dir):
+    """Child process: extract every PDF in the corpus with one backend and print the stats."""
+    from backend import iter_pdf_pages
+
+    files = sorted(os.listdir(corpus_dir))
+    pages = chars = 0
+    start = time.perf_counter()
+    for name in files:
+        with open(os.path.join(corpus_dir, name), "rb") as f:
+            for text in iter_pdf_pages(f, max_pages=1000, max_chars=10 ** 9, time_budget=600, backend=backend):
+                pages += 1
+                chars += len(text)
+    elapsed = time.perf_counter() - start
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB on Linux
+    print(f"{backend:>11} {pages:>6} {chars:>9} {elapsed:>8.2f} {pages / elapsed:>10.1f} {peak_rss_mb:>9.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run_backend(sys.argv[1], sys.argv[2])
+        sys.exit(0)
+
+    from backend import PDF_BACKENDS
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        for pages in PAGE_COUNTS:
+            for copy in range(COPIES):
+                with open(os.path.join(corpus_dir, f"resume_{pages:02d}p_{copy}.pdf"), "wb") as f:
+                    f.write(make_resume_pdf(pages, seed=pages * 100 + copy))
+
+        print(f"Corpus: {COPIES} resumes each of {PAGE_COUNTS} pages")
+        print(f"{'backend':>11} {'pages':>6} {'chars':>9} {'seconds':>8} {'pages/sec':>10} {'peak MB':>9}")
+        for backend in PDF_BACKENDS:
+            subprocess.run([sys.executable, os.path.abspath(__file__), backend, corpus_dir], check=False)
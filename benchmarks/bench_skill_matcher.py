@@ -0,0 +1,63 @@
+"""
+Micro-benchmark: per-resume skill extraction latency, legacy substring scan vs
+the precompiled single-pass SkillMatcher.
+
+Run from the project root:
+    python benchmarks/bench_skill_matcher.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import extract_resume_skills  # noqa: E402
+from taxonomy import TAXONOMY  # noqa: E402
+
+SKILL_CATEGORIES = TAXONOMY.skill_categories
+
+CHARS_PER_PAGE = 3000
+PAGE_COUNTS = [2, 10, 50]
+
+FILLER = (
+    "Led a cross-functional team to deliver projects on time and improved customer "
+    "satisfaction across regions while mentoring junior engineers and writing documentation "
+    "for internal stakeholders during quarterly planning cycles"
+).split()
+
+
+def legacy_extract_resume_skills(resume_text):
+    """The original implementation: rebuild the table, one substring scan per skill."""
+    skill_categories = {category: list(terms) for category, terms in SKILL_CATEGORIES.items()}
+    all_skills = [skill for category in skill_categories.values() for skill in category]
+    resume_lower = resume_text.lower()
+    found_skills = {skill.title() if not skill.isupper() else skill for skill in all_skills if skill in resume_lower}
+    return list(found_skills) if found_skills else ["Software Engineer"]
+
+
+def make_resume(pages, seed=42):
+    """Builds a synthetic resume of roughly `pages` pages with skills sprinkled in."""
+    rng = random.Random(seed)
+    skills = [skill for terms in SKILL_CATEGORIES.values() for skill in terms]
+    words, size = [], 0
+    while size < pages * CHARS_PER_PAGE:
+        word = rng.choice(skills) if rng.random() < 0.05 else rng.choice(FILLER)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def bench(func, text, repeat=5):
+    number = max(1, 200 // max(1, len(text) // CHARS_PER_PAGE))
+    best = min(timeit.repeat(lambda: func(text), number=number, repeat=repeat))
+    return best / number * 1000
+
+
+if __name__ == "__main__":
+    print(f"{'pages':>6} {'chars':>8} {'legacy ms':>10} {'matcher ms':>11} {'speedup':>8}")
+    for pages in PAGE_COUNTS:
+        text = make_resume(pages)
+        legacy = bench(legacy_extract_resume_skills, text)
+        current = bench(extract_resume_skills, text)
+        print(f"{pages:>6} {len(text):>8} {legacy:>10.3f} {current:>11.3f} {legacy / current:>7.1f}x")
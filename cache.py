@@ -0,0 +1,319 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# ============================================
+# IN-MEMORY CACHE
+# ============================================
+class MemoryCache:
+    """Thread-safe LRU cache with per-entry TTL, bounded by entry count and total bytes.
+
+    Values are stored pickled, so the byte cap reflects what is really held
+    and callers never share mutable objects through the cache.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _expiry(self, ttl: Optional[float]) -> Optional[float]:
+        ttl = self.ttl if ttl is None else ttl
+        return time.monotonic() + ttl if ttl else None
+
+    def _remove(self, key: str) -> None:
+        blob, _ = self._data.pop(key)
+        self._bytes -= len(blob)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            blob, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(blob)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """Stores a value; returns False if it is larger than the whole cache."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return False
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (blob, self._expiry(ttl))
+            self._bytes += len(blob)
+            self._evict()
+        return True
+
+    def touch(self, key: str, ttl: Optional[float] = None) -> bool:
+        """Extends an entry's lifetime without rewriting it."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False
+            self._data[key] = (entry[0], self._expiry(ttl))
+            self._data.move_to_end(key)
+        return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def _evict(self) -> None:
+        if len(self._data) <= self.max_entries and self._bytes <= self.max_bytes:
+            return
+        # Over a cap: reclaim expired entries first, then the least recently used
+        now = time.monotonic()
+        for key in [k for k, (_, expires) in self._data.items() if expires is not None and expires <= now]:
+            self._remove(key)
+            self.evictions += 1
+        while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+# ============================================
+# SQLITE CACHE
+# ============================================
+class SQLiteCache:
+    """Cache with the same interface as MemoryCache, stored in a SQLite file.
+
+    The file can be shared by several worker processes. Entries are evicted
+    least-recently-used first once the entry or byte cap is exceeded.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, max_bytes: int = 256 * 1024 * 1024, ttl: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+                " expires REAL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections cannot be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _expiry(self, ttl: Optional[float]) -> Optional[float]:
+        ttl = self.ttl if ttl is None else ttl
+        return time.time() + ttl if ttl else None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self.get_entry(key)
+        return default if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """Returns (value, expires) for a live entry, with `expires` a time.time() timestamp or None."""
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute("SELECT value, expires FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or (row[1] is not None and row[1] <= now):
+            if row is not None:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self.misses += 1
+            return None
+        conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return pickle.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return False
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+            (key, blob, len(blob), self._expiry(ttl), time.time())
+        )
+        self._evict(conn)
+        return True
+
+    def touch(self, key: str, ttl: Optional[float] = None) -> bool:
+        cursor = self._connect().execute(
+            "UPDATE cache SET expires = ?, accessed = ? WHERE key = ?", (self._expiry(ttl), time.time(), key)
+        )
+        return cursor.rowcount > 0
+
+    def delete(self, key: str) -> None:
+        self._connect().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM cache")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        removed = conn.execute("DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?", (time.time(),)).rowcount
+        count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache").fetchone()
+        while count > self.max_entries or size > self.max_bytes:
+            # Drop least recently used rows in small batches rather than one query per row
+            batch = max(1, count - self.max_entries, count // 100)
+            removed += conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed LIMIT ?)", (batch,)
+            ).rowcount
+            count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache").fetchone()
+        self.evictions += removed
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        count, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache").fetchone()
+        return {
+            "entries": count,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+# ============================================
+# TIERED CACHE
+# ============================================
+class TieredCache:
+    """A MemoryCache in front of an optional persistent tier (e.g. SQLiteCache).
+
+    Reads fall through to the persistent tier and promote hits into memory
+    for the rest of their lifetime; writes go to both.
+    """
+
+    def __init__(self, memory: MemoryCache, persistent: Optional[SQLiteCache] = None):
+        self.memory = memory
+        self.persistent = persistent
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.memory.get(key)
+        if value is None and self.persistent is not None:
+            entry = self.persistent.get_entry(key)
+            if entry is not None:
+                value, expires = entry
+                # A ttl of 0 would mean "never expires", so keep at least a millisecond
+                ttl = max(expires - time.time(), 0.001) if expires is not None else None
+                self.memory.set(key, value, ttl)
+        return default if value is None else value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        stored = self.memory.set(key, value, ttl)
+        if self.persistent is not None:
+            stored = self.persistent.set(key, value, ttl) or stored
+        return stored
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        if self.persistent is not None:
+            self.persistent.delete(key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.persistent is not None:
+            self.persistent.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"memory": self.memory.stats()}
+        if self.persistent is not None:
+            stats["persistent"] = self.persistent.stats()
+        return stats
+
+# ============================================
+# REQUEST COALESCING
+# ============================================
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller runs the function; callers arriving while it is in flight
+    wait for it and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        return {"executions": self.executions, "coalesced": self.coalesced, "in_flight": len(self._flights)}
@@ -0,0 +1,96 @@
+import random
+import re
+import zlib
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+# ============================================
+# NEAR-DUPLICATE DETECTION
+# ============================================
+_MERSENNE_PRIME = (1 << 31) - 1
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+def shingles(text: str, size: int = 3) -> Set[int]:
+    """Hashed word `size`-grams of a text (the whole text when it is shorter)."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return {zlib.crc32(" ".join(words).encode())}
+    return {zlib.crc32(" ".join(words[i:i + size]).encode()) for i in range(len(words) - size + 1)}
+
+class MinHasher:
+    """MinHash signatures with LSH banding for clustering near-duplicate texts.
+
+    Texts are only compared when they share a band bucket, so clustering stays
+    close to linear in the number of texts. With 64 permutations in 16 bands
+    of 4, pairs above about 0.5 Jaccard similarity become candidates; candidates
+    are then checked against `threshold` using their full signatures.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)]
+
+    def signatures(self, texts: Sequence[str], min_shingles: int = 1) -> List[Optional[Tuple[int, ...]]]:
+        """One signature per text; uses NumPy when installed.
+
+        Texts with fewer than `min_shingles` shingles get None: a few words are
+        too little evidence, and such texts are never paired.
+        """
+        shingle_sets = [[h % _MERSENNE_PRIME for h in shingles(text)] for text in texts]
+        try:
+            import numpy as np
+        except ImportError:
+            return [
+                tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms)
+                if len(hashes) >= min_shingles else None
+                for hashes in shingle_sets
+            ]
+
+        a = np.array([a for a, _ in self._perms], dtype=np.uint64)[:, None]
+        b = np.array([b for _, b in self._perms], dtype=np.uint64)[:, None]
+        # a, b and the hashes are below 2**31, so a * h + b cannot overflow 64 bits
+        return [
+            tuple(((a * np.array(hashes, dtype=np.uint64) + b) % _MERSENNE_PRIME).min(axis=1).tolist())
+            if len(hashes) >= min_shingles else None
+            for hashes in shingle_sets
+        ]
+
+    def similarity(self, first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of the texts behind two signatures."""
+        return sum(x == y for x, y in zip(first, second)) / self.num_perm
+
+    def candidate_pairs(self, signatures: Sequence[Optional[Tuple[int, ...]]]) -> Set[Tuple[int, int]]:
+        """Index pairs that share at least one LSH band bucket; None signatures are skipped."""
+        pairs: Set[Tuple[int, int]] = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets: Dict[Tuple[int, ...], List[int]] = {}
+            for index, signature in enumerate(signatures):
+                if signature is None:
+                    continue
+                buckets.setdefault(signature[start:start + self.rows], []).append(index)
+            for members in buckets.values():
+                for i, first in enumerate(members):
+                    for second in members[i + 1:]:
+                        pairs.add((first, second))
+        return pairs
+
+def cluster_labels(count: int, pairs: Sequence[Tuple[int, int]]) -> List[int]:
+    """Union-find over `count` items; returns each item's cluster label (its lowest member index)."""
+    parent = list(range(count))
+
+    def find(item: int) -> int:
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    for first, second in pairs:
+        root_first, root_second = find(first), find(second)
+        if root_first != root_second:
+            parent[max(root_first, root_second)] = min(root_first, root_second)
+    return [find(item) for item in range(count)]
@@ -0,0 +1,125 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Sequence
+
+# ============================================
+# LOCAL JOB INDEX
+# ============================================
+class JobStore:
+    """Jobs returned by upstream searches, kept in SQLite and indexed with FTS5.
+
+    Jobs are upserted by link and stamped with when they were last seen. Each
+    one carries the canonical skills found in it, so local results can be
+    ranked by overlap with a resume's skills.
+    """
+
+    def __init__(self, path: str, max_jobs: int = 20000, retention: float = 7 * 24 * 60 * 60):
+        self.path = path
+        self.max_jobs = max_jobs
+        self.retention = retention
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " link TEXT PRIMARY KEY, title TEXT NOT NULL, company TEXT NOT NULL, location TEXT NOT NULL,"
+            " description TEXT NOT NULL, skills TEXT NOT NULL, search_location TEXT NOT NULL, seen REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS jobs_seen ON jobs (seen)")
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(title, description, skills)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections cannot be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def upsert(self, jobs: Sequence[Dict[str, Any]], skills: Sequence[List[str]], search_location: str) -> int:
+        """Adds or refreshes jobs (with their canonical skills); jobs without a real link are skipped."""
+        now = time.time()
+        conn = self._connect()
+        stored = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for job, job_skills in zip(jobs, skills):
+                link = job.get("link") or ""
+                if not link.startswith("http"):
+                    continue
+                skills_text = ", ".join(job_skills)
+                conn.execute(
+                    "INSERT INTO jobs (link, title, company, location, description, skills, search_location, seen)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT(link) DO UPDATE SET title = excluded.title, company = excluded.company,"
+                    " location = excluded.location, description = excluded.description, skills = excluded.skills,"
+                    " search_location = excluded.search_location, seen = excluded.seen",
+                    (link, job.get("title", ""), job.get("company", ""), job.get("location", ""),
+                     job.get("description", ""), skills_text, search_location, now)
+                )
+                rowid = conn.execute("SELECT rowid FROM jobs WHERE link = ?", (link,)).fetchone()[0]
+                conn.execute("DELETE FROM jobs_fts WHERE rowid = ?", (rowid,))
+                conn.execute(
+                    "INSERT INTO jobs_fts (rowid, title, description, skills) VALUES (?, ?, ?, ?)",
+                    (rowid, job.get("title", ""), job.get("description", ""), skills_text)
+                )
+                stored += 1
+            self._prune(conn, now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return stored
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        cutoff = now - self.retention
+        count = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        if count > self.max_jobs:
+            # Keep the most recently seen jobs
+            cutoff = max(cutoff, conn.execute(
+                "SELECT seen FROM jobs ORDER BY seen DESC LIMIT 1 OFFSET ?", (self.max_jobs,)
+            ).fetchone()[0])
+        conn.execute("DELETE FROM jobs_fts WHERE rowid IN (SELECT rowid FROM jobs WHERE seen <= ?)", (cutoff,))
+        conn.execute("DELETE FROM jobs WHERE seen <= ?", (cutoff,))
+
+    @staticmethod
+    def _match_query(skills: Sequence[str]) -> str:
+        # Only the skills column: "go", "r" and "c++" tokenize to words that ordinary descriptions contain
+        return "skills : (" + " OR ".join('"' + skill.replace('"', '""') + '"' for skill in skills) + ")"
+
+    def search(self, skills: Sequence[str], location: str, limit: int, max_age: float) -> List[Dict[str, Any]]:
+        """Fresh jobs in `location` mentioning any of `skills`, best skill overlap first.
+
+        Ties are broken by FTS5 bm25 relevance, then by how recently the job was seen.
+        """
+        if not skills:
+            return []
+        wanted = set(skills)
+        rows = self._connect().execute(
+            "SELECT j.link, j.title, j.company, j.location, j.description, j.skills, bm25(jobs_fts), j.seen"
+            " FROM jobs_fts JOIN jobs j ON j.rowid = jobs_fts.rowid"
+            " WHERE jobs_fts MATCH ? AND j.seen >= ?"
+            " AND (j.search_location = ? COLLATE NOCASE OR j.location LIKE ?)"
+            " ORDER BY bm25(jobs_fts) LIMIT ?",
+            (self._match_query(skills), time.time() - max_age, location, f"%{location}%", max(limit * 10, 100))
+        ).fetchall()
+
+        def overlap(row):
+            return len(wanted.intersection(row[5].split(", "))) if row[5] else 0
+
+        # FTS5 matches tokens ("c" for both "c++" and "c#"), so keep only exact skill overlaps
+        matches = [row for row in rows if overlap(row)]
+        matches.sort(key=lambda row: (-overlap(row), row[6], -row[7]))
+        return [
+            {"title": title, "company": company, "location": job_location, "description": description, "link": link}
+            for link, title, company, job_location, description, *_ in matches[:limit]
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        return {"jobs": self._connect().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]}
@@ -0,0 +1,115 @@
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+# ============================================
+# RATE LIMITING
+# ============================================
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+        self.rejected = 0
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Takes one token, sleeping until one is available; False if that would exceed `timeout`."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                delay = (1 - self._tokens) / self.rate
+                if deadline is not None and now + delay > deadline:
+                    self.rejected += 1
+                    return False
+                self.waited += delay
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {"tokens": round(self._tokens, 2), "waited_seconds": round(self.waited, 2), "rejected": self.rejected}
+
+_rate_limiter: Optional[TokenBucket] = None
+_rate_limit_wait: Optional[float] = None
+
+def set_rate_limit(requests_per_minute: float, burst: int, max_wait: Optional[float] = None) -> TokenBucket:
+    """Limits every Gemini call made through this module to the given quota."""
+    global _rate_limiter, _rate_limit_wait
+    _rate_limiter = TokenBucket(requests_per_minute / 60.0, burst)
+    _rate_limit_wait = max_wait
+    return _rate_limiter
+
+def _throttle() -> None:
+    if _rate_limiter is not None and not _rate_limiter.acquire(_rate_limit_wait):
+        raise RuntimeError(f"Gemini rate limit: no request slot within {_rate_limit_wait:g}s")
+
+def rate_limit_stats() -> Optional[Dict[str, float]]:
+    return _rate_limiter.stats() if _rate_limiter is not None else None
+
+# ============================================
+# GEMINI CLIENT
+# ============================================
+# google.generativeai keeps its API key in module-global state, so it is
+# configured once here, under a lock, instead of on every request.
+_lock = threading.Lock()
+_configured_key: Optional[str] = None
+_models: Dict[str, Any] = {}
+
+def get_model(model_name: str, api_key: str) -> Any:
+    """Returns a shared GenerativeModel, importing and configuring the SDK on first use."""
+    model = _models.get(model_name)
+    if model is not None:
+        return model
+
+    global _configured_key
+    with _lock:
+        model = _models.get(model_name)
+        if model is None:
+            import google.generativeai as genai
+
+            if _configured_key != api_key:
+                genai.configure(api_key=api_key)
+                _configured_key = api_key
+            model = _models[model_name] = genai.GenerativeModel(model_name)
+    return model
+
+def generate_text(prompt: str, model_name: str, api_key: str) -> str:
+    """Runs a single non-streaming generation and returns its text."""
+    _throttle()
+    return get_model(model_name, api_key).generate_content(prompt).text
+
+def warm_up(model_name: str, api_key: str, background: bool = True) -> Optional[threading.Thread]:
+    """Imports the SDK and builds the model handle ahead of the first request."""
+    def run():
+        start = time.perf_counter()
+        try:
+            get_model(model_name, api_key)
+            print(f"✓ Gemini client ready ({model_name}, {time.perf_counter() - start:.2f}s)")
+        except Exception as e:
+            print(f"⚠️ Gemini warm-up failed: {e}")
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name="llm-warmup", daemon=True)
+    thread.start()
+    return thread
+
+def stream_text(prompt: str, model_name: str, api_key: str) -> Iterator[str]:
+    """Runs a streaming generation, yielding text fragments as the model produces them."""
+    _throttle()
+    for chunk in get_model(model_name, api_key).generate_content(prompt, stream=True):
+        # chunk.text raises on chunks without text parts (e.g. the final one)
+        text = "".join(getattr(part, "text", "") for part in chunk.parts)
+        if text:
+            yield text
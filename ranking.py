@@ -0,0 +1,102 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Sequence
+
+# ============================================
+# RESUME-TO-JOB RELEVANCE
+# ============================================
+# Documents are bags of description tokens plus one "skill:<id>" feature per
+# canonical skill, weighted so a known skill outweighs an ordinary word.
+SKILL_WEIGHT = 3
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]*")
+_STOPWORDS = frozenset(
+    "a about an and are as at be by can for from has have in is it its of on or our that the their this "
+    "to we will with you your".split()
+)
+
+def features(text: str, skills: Sequence[str]) -> Counter:
+    """Term counts for one document: description tokens and weighted skill features."""
+    counts = Counter(token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS and len(token) > 1)
+    for skill in skills:
+        counts["skill:" + skill] += SKILL_WEIGHT
+    return counts
+
+def score_documents(query: Counter, docs: Sequence[Counter]) -> List[float]:
+    """Cosine similarity in [0, 1] between the TF-IDF vectors of `query` and each doc.
+
+    Uses one sparse matrix-vector product when NumPy and SciPy are installed,
+    and an equivalent pure-Python loop otherwise.
+    """
+    if not docs:
+        return []
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        return _score_python(query, docs)
+    return _score_sparse(query, docs, np, sparse)
+
+def _idf(df: int, n: int) -> float:
+    # Smoothed IDF over the docs plus the query, so every term has a positive weight
+    return math.log((1 + n) / (1 + df)) + 1
+
+def _score_sparse(query: Counter, docs: Sequence[Counter], np, sparse) -> List[float]:
+    vocab: Dict[str, int] = {}
+    indptr = [0]
+    indices: List[int] = []
+    counts: List[float] = []
+    for doc in docs:
+        for term, count in doc.items():
+            indices.append(vocab.setdefault(term, len(vocab)))
+            counts.append(count)
+        indptr.append(len(indices))
+    for term in query:
+        vocab.setdefault(term, len(vocab))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int32)),
+        shape=(len(docs), len(vocab))
+    )
+    query_terms = np.fromiter((vocab[term] for term in query), dtype=np.int64, count=len(query))
+    query_tf = 1 + np.log(np.fromiter(query.values(), dtype=np.float64, count=len(query)))
+
+    df = np.bincount(matrix.indices, minlength=len(vocab))
+    df[query_terms] += 1
+    n = len(docs) + 1
+    idf = np.log((1 + n) / (1 + df)) + 1
+
+    # Sublinear TF times IDF, then L2-normalize every row
+    matrix.data = (1 + np.log(matrix.data)) * idf[matrix.indices]
+    row_norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+
+    query_vector = np.zeros(len(vocab))
+    query_vector[query_terms] = query_tf * idf[query_terms]
+    query_norm = np.linalg.norm(query_vector)
+    if not query_norm:
+        return [0.0] * len(docs)
+
+    dots = matrix @ query_vector
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(row_norms > 0, dots / (row_norms * query_norm), 0.0)
+    return scores.tolist()
+
+def _score_python(query: Counter, docs: Sequence[Counter]) -> List[float]:
+    df: Counter = Counter()
+    for doc in docs:
+        df.update(doc.keys())
+    df.update(query.keys())
+    n = len(docs) + 1
+
+    def weigh(doc: Counter) -> Dict[str, float]:
+        return {term: (1 + math.log(count)) * _idf(df[term], n) for term, count in doc.items()}
+
+    query_weights = weigh(query)
+    query_norm = math.sqrt(sum(w * w for w in query_weights.values()))
+    scores = []
+    for doc in docs:
+        weights = weigh(doc)
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        dot = sum(w * query_weights.get(term, 0.0) for term, w in weights.items())
+        scores.append(dot / (norm * query_norm) if norm and query_norm else 0.0)
+    return scores
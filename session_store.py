@@ -0,0 +1,85 @@
+import secrets
+from typing import Any, Dict, Optional
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+from cache import MemoryCache, SQLiteCache
+
+# ============================================
+# SERVER-SIDE SESSIONS
+# ============================================
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Session data kept on the server; the cookie only carries `sid`."""
+
+    def __init__(self, initial: Optional[Dict[str, Any]] = None, sid: str = "", new: bool = False):
+        def on_update(session):
+            session.modified = True
+
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+
+class ServerSideSessionInterface(SessionInterface):
+    """Flask session interface backed by a MemoryCache or SQLiteCache store."""
+
+    def __init__(self, store):
+        self.store = store
+
+    @staticmethod
+    def _new_sid() -> str:
+        return secrets.token_urlsafe(32)
+
+    def open_session(self, app, request) -> ServerSideSession:
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            data = self.store.get(sid)
+            if data is not None:
+                return ServerSideSession(data, sid=sid)
+        return ServerSideSession(sid=self._new_sid(), new=True)
+
+    def save_session(self, app, session: ServerSideSession, response) -> None:
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if session.modified:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        ttl = app.permanent_session_lifetime.total_seconds()
+        if session.modified:
+            self.store.set(session.sid, dict(session), ttl=ttl)
+        elif self.should_set_cookie(app, session):
+            self.store.touch(session.sid, ttl=ttl)
+
+        if session.modified or self.should_set_cookie(app, session):
+            response.set_cookie(
+                name,
+                session.sid,
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app)
+            )
+
+def create_session_interface(config: Dict[str, Any]) -> ServerSideSessionInterface:
+    """Builds the session interface selected by SESSION_BACKEND ('memory' or 'sqlite')."""
+    backend = config.get("SESSION_BACKEND", "memory")
+    ttl = config["PERMANENT_SESSION_LIFETIME"].total_seconds()
+    max_entries = config.get("SESSION_MAX_ENTRIES", 1000)
+    max_bytes = config.get("SESSION_MAX_BYTES", 64 * 1024 * 1024)
+
+    if backend == "sqlite":
+        store = SQLiteCache(config.get("SESSION_SQLITE_PATH", "sessions.db"), max_entries, max_bytes, ttl)
+    elif backend == "memory":
+        store = MemoryCache(max_entries, max_bytes, ttl)
+    else:
+        raise ValueError(f"Unknown SESSION_BACKEND: {backend}")
+
+    return ServerSideSessionInterface(store)
@@ -3,7 +3,9 @@
 // ============================================
 let sessionId = null;
 let currentJobs = [];
+let nextJobsCursor = null;  // opaque cursor for the next page of /search-jobs
 let currentResearch = {};
+let regenerateCoverLetter = null;  // redoes whatever filled the cover letter modal
 
 // ============================================
 // PARTICLE ANIMATION
@@ -176,6 +178,71 @@ function hideLoading() {
     overlay.classList.remove('active');
 }
 
+// ============================================
+// SERVER-SENT EVENTS
+// ============================================
+// EventSource only supports GET, so POST endpoints are streamed with fetch
+// and parsed here. onEvent(eventName, data) is called for every event.
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            
+            let eventName = 'message';
+            const dataLines = [];
+            rawEvent.split('\n').forEach(line => {
+                if (line.startsWith('event:')) eventName = line.slice(6).trim();
+                else if (line.startsWith('data:')) dataLines.push(line.slice(5).trim());
+            });
+            onEvent(eventName, dataLines.length ? JSON.parse(dataLines.join('\n')) : {});
+        }
+    }
+}
+
+function isEventStream(response) {
+    return response.ok && response.body &&
+        (response.headers.get('Content-Type') || '').startsWith('text/event-stream');
+}
+
+// ============================================
+// BACKGROUND TASKS
+// ============================================
+// Queues slow work through a /tasks/... endpoint and long-polls until it finishes.
+// Resolves to the task result with success: true, or to { success: false, error }.
+async function runTask(url, body) {
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify(body)
+    });
+    const queued = await response.json();
+    if (!queued.success) return queued;
+    
+    while (true) {
+        const poll = await fetch(`/tasks/${queued.task_id}?wait=25`);
+        const data = await poll.json();
+        if (!data.success) return data;
+        
+        const task = data.task;
+        if (task.status === 'done') return { success: true, ...task.result };
+        if (task.status === 'failed' || task.status === 'cancelled') {
+            return { success: false, error: task.error || `Task ${task.status}` };
+        }
+    }
+}
+
 // ============================================
 // RESUME UPLOAD
 // ============================================
@@ -309,6 +376,7 @@ function initJobSearch() {
             if (data.success) {
                 currentJobs = data.jobs;
                 displayJobs(data.jobs);
+                setNextJobsCursor(data.next_cursor);
                 updateStats({ jobs: data.jobs.length });
                 showToast(`Found ${data.jobs.length} jobs!`, 'success');
                 
@@ -324,6 +392,54 @@ function initJobSearch() {
             hideLoading();
         }
     });
+    
+    document.getElementById('moreJobsBtn').addEventListener('click', loadMoreJobs);
+}
+
+function setNextJobsCursor(cursor) {
+    nextJobsCursor = cursor || null;
+    document.getElementById('moreJobsBtn').style.display = nextJobsCursor ? 'flex' : 'none';
+}
+
+// The next page is prefetched by the server while the current one is read
+async function loadMoreJobs() {
+    if (!nextJobsCursor) return;
+    
+    const moreBtn = document.getElementById('moreJobsBtn');
+    moreBtn.disabled = true;
+    
+    try {
+        const response = await fetch('/search-jobs', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                session_id: sessionId,
+                cursor: nextJobsCursor
+            })
+        });
+        
+        const data = await response.json();
+        
+        if (data.success) {
+            currentJobs = currentJobs.concat(data.jobs);
+            displayJobs(currentJobs);
+            setNextJobsCursor(data.next_cursor);
+            updateStats({ jobs: currentJobs.length });
+            if (data.jobs.length === 0) {
+                showToast('No more new jobs right now', 'info');
+            }
+        } else {
+            setNextJobsCursor(null);
+            showToast(data.error || 'Could not load more jobs', 'error');
+        }
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error(error);
+    } finally {
+        moreBtn.disabled = false;
+    }
 }
 
 // FIXED: displayJobs function using proper event listeners
@@ -365,6 +481,7 @@ function displayJobs(jobs) {
                         <i class="fas fa-map-marker-alt"></i>
                         <span>${escapeHtml(job.location)}</span>
                     </div>
+                    ${jobMatchHtml(job)}
                 </div>
                 <div class="job-actions" data-job-index="${index}">
                 </div>
@@ -403,6 +520,21 @@ function displayJobs(jobs) {
     });
 }
 
+// Match score and matched resume skills added by the server's ranking stage
+function jobMatchHtml(job) {
+    if (job.match_score === undefined) return '';
+    const skills = (job.matched_skills || [])
+        .map(skill => `<span class="skill-tag">${escapeHtml(skill)}</span>`)
+        .join('');
+    return `
+        <div class="job-match">
+            <i class="fas fa-bullseye"></i>
+            <span>${job.match_score}% match</span>
+            ${skills}
+        </div>
+    `;
+}
+
 // Helper function to escape HTML
 function escapeHtml(text) {
     const map = {
@@ -424,7 +556,8 @@ function researchCompanyFromJob(jobIndex) {
 // ============================================
 // COVER LETTER
 // ============================================
-async function generateCoverLetter(jobIndex) {
+// regenerate: ask the server for a fresh letter instead of a cached one
+async function generateCoverLetter(jobIndex, regenerate = false) {
     if (!sessionId) {
         showToast('Session expired. Please upload resume again.', 'error');
         navigateToPage('home');
@@ -437,21 +570,67 @@ async function generateCoverLetter(jobIndex) {
     }
     
     const job = currentJobs[jobIndex];
+    regenerateCoverLetter = () => generateCoverLetter(jobIndex, true);
     showLoading('Generating personalized cover letter...');
     
     try {
-        const response = await fetch('/generate-cover-letter', {
+        const response = await fetch('/generate-cover-letter/stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
             },
             body: JSON.stringify({
                 session_id: sessionId,
-                job: job
+                job: job,
+                regenerate: regenerate
             })
         });
         
-        const data = await response.json();
+        if (isEventStream(response)) {
+            await streamCoverLetter(response, job.company);
+            return;
+        }
+    } catch (error) {
+        console.error('Cover letter stream error, retrying without streaming:', error);
+    } finally {
+        hideLoading();
+    }
+    
+    await fetchCoverLetter(job, regenerate);
+}
+
+// Renders the letter as it is generated; a 'fallback' event replaces it with the template
+async function streamCoverLetter(response, companyName) {
+    const textarea = document.getElementById('coverLetterText');
+    let started = false;
+    
+    await readEventStream(response, (event, data) => {
+        if (!started) {
+            hideLoading();
+            showCoverLetterModal('', companyName);
+            started = true;
+        }
+        if (event === 'chunk') {
+            textarea.value += data.text;
+            textarea.scrollTop = textarea.scrollHeight;
+        } else if (event === 'fallback') {
+            textarea.value = data.text;
+        }
+    });
+    
+    showToast('Cover letter generated!', 'success');
+}
+
+// Background task, used when the stream cannot be opened
+async function fetchCoverLetter(job, regenerate = false) {
+    showLoading('Generating personalized cover letter...');
+    
+    try {
+        const data = await runTask('/tasks/cover-letter', {
+            session_id: sessionId,
+            job: job,
+            regenerate: regenerate
+        });
         
         if (data.success) {
             showCoverLetterModal(data.cover_letter, job.company);
@@ -473,6 +652,7 @@ function showCoverLetterModal(letter, companyName) {
     const closeBtn = modal.querySelector('.modal-close');
     const copyBtn = document.getElementById('copyCoverLetter');
     const downloadBtn = document.getElementById('downloadCoverLetter');
+    const regenerateBtn = document.getElementById('regenerateCoverLetter');
     
     textarea.value = letter;
     modal.classList.add('active');
@@ -484,6 +664,8 @@ function showCoverLetterModal(letter, companyName) {
     copyBtn.parentNode.replaceChild(newCopyBtn, copyBtn);
     const newDownloadBtn = downloadBtn.cloneNode(true);
     downloadBtn.parentNode.replaceChild(newDownloadBtn, downloadBtn);
+    const newRegenerateBtn = regenerateBtn.cloneNode(true);
+    regenerateBtn.parentNode.replaceChild(newRegenerateBtn, regenerateBtn);
     
     // Add new event listeners
     newCloseBtn.addEventListener('click', () => modal.classList.remove('active'));
@@ -495,7 +677,7 @@ function showCoverLetterModal(letter, companyName) {
     });
     
     newDownloadBtn.addEventListener('click', () => {
-        const blob = new Blob([letter], { type: 'text/plain' });
+        const blob = new Blob([textarea.value], { type: 'text/plain' });
         const url = URL.createObjectURL(blob);
         const a = document.createElement('a');
         a.href = url;
@@ -505,6 +687,11 @@ function showCoverLetterModal(letter, companyName) {
         showToast('Downloaded!', 'success');
     });
     
+    newRegenerateBtn.addEventListener('click', () => {
+        modal.classList.remove('active');
+        regenerateCoverLetter();
+    });
+    
     // Close on outside click
     modal.onclick = (e) => {
         if (e.target === modal) {
@@ -513,11 +700,82 @@ function showCoverLetterModal(letter, companyName) {
     };
 }
 
+// ============================================
+// BATCH COVER LETTERS
+// ============================================
+const COVER_LETTER_BATCH_MAX = 10;
+
+function initBatchCoverLetters() {
+    document.getElementById('allCoverLettersBtn').addEventListener('click', () => generateAllCoverLetters());
+}
+
+// Letters arrive as each one finishes; the modal lists them in job order
+async function generateAllCoverLetters(regenerate = false) {
+    if (!sessionId) {
+        showToast('Session expired. Please upload resume again.', 'error');
+        navigateToPage('home');
+        return;
+    }
+    
+    if (currentJobs.length === 0) {
+        showToast('Search for jobs first', 'error');
+        return;
+    }
+    
+    const jobs = currentJobs.slice(0, COVER_LETTER_BATCH_MAX);
+    const letters = new Array(jobs.length).fill(null);
+    const render = () => jobs.map((job, i) =>
+        `=== ${job.title} at ${job.company} ===\n\n${letters[i] === null ? 'Generating...' : letters[i]}`
+    ).join('\n\n\n');
+    
+    regenerateCoverLetter = () => generateAllCoverLetters(true);
+    showLoading(`Generating ${jobs.length} cover letters...`);
+    
+    try {
+        const response = await fetch('/generate-cover-letters/stream', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                session_id: sessionId,
+                jobs: jobs,
+                regenerate: regenerate
+            })
+        });
+        
+        if (!isEventStream(response)) {
+            const data = await response.json().catch(() => ({}));
+            showToast(data.error || 'Generation failed', 'error');
+            return;
+        }
+        
+        hideLoading();
+        showCoverLetterModal(render(), 'all_jobs');
+        const textarea = document.getElementById('coverLetterText');
+        
+        await readEventStream(response, (event, data) => {
+            if (event === 'letter') {
+                letters[data.index] = data.text;
+                textarea.value = render();
+            }
+        });
+        
+        showToast(`${jobs.length} cover letters generated!`, 'success');
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error('Batch cover letter error:', error);
+    } finally {
+        hideLoading();
+    }
+}
+
 // ============================================
 // SKILL GAP ANALYSIS
 // ============================================
 function initSkillAnalysis() {
     const analyzeBtn = document.getElementById('analyzeSkillsBtn');
+    document.getElementById('analyzeAllJobsBtn').addEventListener('click', analyzeAllJobs);
     
     analyzeBtn.addEventListener('click', async () => {
         if (!sessionId) {
@@ -533,40 +791,150 @@ function initSkillAnalysis() {
             return;
         }
         
-        showLoading('Analyzing skill gaps...');
+        await analyzeSkills(jobDescription);
+    });
+}
+
+async function analyzeSkills(jobDescription) {
+    showLoading('Analyzing skill gaps...');
+    
+    try {
+        const response = await fetch('/analyze-skills/stream', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                session_id: sessionId,
+                job_description: jobDescription
+            })
+        });
         
-        try {
-            const response = await fetch('/analyze-skills', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({
-                    session_id: sessionId,
-                    job_description: jobDescription
-                })
-            });
+        if (isEventStream(response)) {
+            await streamSkillAnalysis(response);
+            return;
+        }
+    } catch (error) {
+        console.error('Skill analysis stream error, retrying without streaming:', error);
+    } finally {
+        hideLoading();
+    }
+    
+    await fetchSkillAnalysis(jobDescription);
+}
+
+// The analysis arrives first, then curated courses, then YouTube results one skill at a time
+async function streamSkillAnalysis(response) {
+    let courses = [];
+    
+    await readEventStream(response, (event, data) => {
+        if (event === 'analysis') {
+            hideLoading();
+            displaySkillAnalysis(data.analysis);
+            if (data.analysis.missing_skills.length === 0) displayCourses([]);
+        } else if (event === 'courses') {
+            courses = data.courses;
+            displayCourses(courses);
+            updateStats({ courses: courses.length });
+        } else if (event === 'youtube') {
+            const courseSet = courses.find(set => set.skill === data.skill);
+            if (courseSet) {
+                courseSet.youtube = data.youtube;
+                displayCourses(courses);
+            }
+        }
+    });
+    
+    showToast('Analysis complete!', 'success');
+}
+
+// Two requests (analysis, then courses), used when the stream cannot be opened
+async function fetchSkillAnalysis(jobDescription) {
+    showLoading('Analyzing skill gaps...');
+    
+    try {
+        const response = await fetch('/analyze-skills', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                session_id: sessionId,
+                job_description: jobDescription
+            })
+        });
+        
+        const data = await response.json();
+        
+        if (data.success) {
+            displaySkillAnalysis(data.analysis);
             
-            const data = await response.json();
+            if (data.analysis.missing_skills.length > 0) {
+                await fetchCourses(data.analysis.missing_skills);
+            }
             
-            if (data.success) {
-                displaySkillAnalysis(data.analysis);
-                
-                if (data.analysis.missing_skills.length > 0) {
-                    await fetchCourses(data.analysis.missing_skills);
-                }
-                
-                showToast('Analysis complete!', 'success');
-            } else {
-                showToast(data.error || 'Analysis failed', 'error');
+            showToast('Analysis complete!', 'success');
+        } else {
+            showToast(data.error || 'Analysis failed', 'error');
+        }
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error(error);
+    } finally {
+        hideLoading();
+    }
+}
+
+// Gap analysis across every job from the last search; the most common gaps drive the courses
+async function analyzeAllJobs() {
+    if (!sessionId) {
+        showToast('Please upload your resume first', 'error');
+        navigateToPage('home');
+        return;
+    }
+    
+    if (currentJobs.length === 0) {
+        showToast('Search for jobs first', 'error');
+        return;
+    }
+    
+    showLoading(`Analyzing ${currentJobs.length} jobs...`);
+    
+    try {
+        const response = await fetch('/analyze-skills/batch', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                session_id: sessionId,
+                jobs: currentJobs
+            })
+        });
+        
+        const data = await response.json();
+        
+        if (data.success) {
+            const gaps = data.analysis.top_missing_skills;
+            displaySkillAnalysis({
+                matched_skills: data.analysis.matched_skills,
+                missing_skills: gaps.map(gap => `${gap.skill} (${gap.jobs} of ${currentJobs.length} jobs)`)
+            });
+            
+            if (gaps.length > 0) {
+                await fetchCourses(gaps.map(gap => gap.skill));
             }
-        } catch (error) {
-            showToast('Network error. Please try again.', 'error');
-            console.error(error);
-        } finally {
-            hideLoading();
+            
+            showToast('Analysis complete!', 'success');
+        } else {
+            showToast(data.error || 'Analysis failed', 'error');
         }
-    });
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error(error);
+    } finally {
+        hideLoading();
+    }
 }
 
 function displaySkillAnalysis(analysis) {
@@ -682,33 +1050,89 @@ function initCompanyResearch() {
     });
 }
 
-async function researchCompany(companyName, jobTitle) {
+// regenerate: ask the server for a fresh brief instead of a cached one
+async function researchCompany(companyName, jobTitle, regenerate = false) {
     showLoading(`Researching ${companyName}...`);
     
     try {
-        const response = await fetch('/research-company', {
+        const response = await fetch('/research-company/stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
             },
             body: JSON.stringify({
                 company_name: companyName,
-                job_title: jobTitle
+                job_title: jobTitle,
+                regenerate: regenerate
             })
         });
         
-        const data = await response.json();
+        if (isEventStream(response)) {
+            await streamResearch(response, companyName, jobTitle);
+            return;
+        }
+    } catch (error) {
+        console.error('Research stream error, retrying without streaming:', error);
+    } finally {
+        hideLoading();
+    }
+    
+    await fetchResearch(companyName, jobTitle, regenerate);
+}
+
+// Fills each tab as its lookup finishes, then renders the brief as it is generated
+async function streamResearch(response, companyName, jobTitle) {
+    const research = {
+        company_name: companyName,
+        job_title: jobTitle,
+        company_info: { news: [], culture: [], hiring: [], overview: [] },
+        interview_questions: [],
+        ai_brief: ''
+    };
+    currentResearch = research;
+    
+    hideLoading();
+    showResearchPage();
+    displayResearch(research, true);
+    
+    await readEventStream(response, (event, data) => {
+        if (event === 'company_info') {
+            research.company_info[data.category] = data.items;
+            if (data.category === 'news') renderResearchNews(research);
+            else if (data.category === 'culture' || data.category === 'hiring') renderResearchCulture(research);
+        } else if (event === 'interview_questions') {
+            research.interview_questions = data.items;
+            renderResearchQuestions(research);
+        } else if (event === 'brief_chunk') {
+            research.ai_brief += data.text;
+            renderResearchBrief(research);
+        } else if (event === 'brief_fallback') {
+            research.ai_brief = data.text;
+            renderResearchBrief(research);
+        }
+    });
+    
+    updateStats({ companiesResearched: 1 });
+    showToast('Research complete!', 'success');
+}
+
+// Background task, used when the stream cannot be opened
+async function fetchResearch(companyName, jobTitle, regenerate = false) {
+    showLoading(`Researching ${companyName}...`);
+    
+    try {
+        const data = await runTask('/tasks/research-company', {
+            company_name: companyName,
+            job_title: jobTitle,
+            regenerate: regenerate
+        });
         
         if (data.success) {
             currentResearch = data.research;
             displayResearch(data.research);
             updateStats({ companiesResearched: 1 });
             showToast('Research complete!', 'success');
-            
-            // Navigate to research page if not already there
-            if (!document.getElementById('research').classList.contains('active')) {
-                navigateToPage('research');
-            }
+            showResearchPage();
         } else {
             showToast(data.error || 'Research failed', 'error');
         }
@@ -720,54 +1144,64 @@ async function researchCompany(companyName, jobTitle) {
     }
 }
 
-function displayResearch(research) {
-    const resultsDiv = document.getElementById('researchResults');
-    const briefContent = document.getElementById('briefContent');
-    const newsTab = document.getElementById('news');
-    const cultureTab = document.getElementById('culture');
-    const questionsTab = document.getElementById('questions');
-    
-    resultsDiv.style.display = 'block';
-    
-    // AI Brief
-    briefContent.innerHTML = marked.parse(research.ai_brief);
-    
-    // News
-    newsTab.innerHTML = research.company_info.news.length > 0
-        ? research.company_info.news.map(item => `
+function showResearchPage() {
+    // Navigate to research page if not already there
+    if (!document.getElementById('research').classList.contains('active')) {
+        navigateToPage('research');
+    }
+}
+
+function researchItemsHtml(items, titleKey, emptyMessage) {
+    return items.length > 0
+        ? items.map(item => `
             <div class="info-item">
-                <h4><a href="${escapeHtml(item.link)}" target="_blank">${escapeHtml(item.title)}</a></h4>
+                <h4><a href="${escapeHtml(item.link)}" target="_blank">${escapeHtml(item[titleKey])}</a></h4>
                 <p>${escapeHtml(item.snippet)}</p>
             </div>
         `).join('')
-        : '<p style="text-align: center; color: #64748b;">No recent news found.</p>';
-    
-    // Culture
+        : `<p style="text-align: center; color: #64748b;">${emptyMessage}</p>`;
+}
+
+function renderResearchBrief(research) {
+    document.getElementById('briefContent').innerHTML = marked.parse(research.ai_brief);
+}
+
+function renderResearchNews(research) {
+    document.getElementById('news').innerHTML =
+        researchItemsHtml(research.company_info.news, 'title', 'No recent news found.');
+}
+
+function renderResearchCulture(research) {
     const cultureItems = [
         ...research.company_info.culture,
         ...research.company_info.hiring
     ];
+    document.getElementById('culture').innerHTML =
+        researchItemsHtml(cultureItems, 'title', 'No culture information found.');
+}
+
+function renderResearchQuestions(research) {
+    document.getElementById('questions').innerHTML =
+        researchItemsHtml(research.interview_questions, 'source', 'No interview questions found.');
+}
+
+// pending: show placeholders in every tab until the streamed results arrive
+function displayResearch(research, pending = false) {
+    document.getElementById('researchResults').style.display = 'block';
     
-    cultureTab.innerHTML = cultureItems.length > 0
-        ? cultureItems.map(item => `
-            <div class="info-item">
-                <h4><a href="${escapeHtml(item.link)}" target="_blank">${escapeHtml(item.title)}</a></h4>
-                <p>${escapeHtml(item.snippet)}</p>
-            </div>
-        `).join('')
-        : '<p style="text-align: center; color: #64748b;">No culture information found.</p>';
-    
-    // Interview Q&A
-    questionsTab.innerHTML = research.interview_questions.length > 0
-        ? research.interview_questions.map(item => `
-            <div class="info-item">
-                <h4><a href="${escapeHtml(item.link)}" target="_blank">${escapeHtml(item.source)}</a></h4>
-                <p>${escapeHtml(item.snippet)}</p>
-            </div>
-        `).join('')
-        : '<p style="text-align: center; color: #64748b;">No interview questions found.</p>';
+    if (pending) {
+        const placeholder = '<p style="text-align: center; color: #64748b;">Loading...</p>';
+        ['briefContent', 'news', 'culture', 'questions'].forEach(id => {
+            document.getElementById(id).innerHTML = placeholder;
+        });
+    } else {
+        renderResearchBrief(research);
+        renderResearchNews(research);
+        renderResearchCulture(research);
+        renderResearchQuestions(research);
+    }
     
-    // Download button
+    // Download button (reads the brief at click time, so a streamed brief is complete)
     const downloadBtn = document.getElementById('downloadBrief');
     const newDownloadBtn = downloadBtn.cloneNode(true);
     downloadBtn.parentNode.replaceChild(newDownloadBtn, downloadBtn);
@@ -782,6 +1216,11 @@ function displayResearch(research) {
         URL.revokeObjectURL(url);
         showToast('Downloaded!', 'success');
     });
+    
+    const regenerateBtn = document.getElementById('regenerateBrief');
+    const newRegenerateBtn = regenerateBtn.cloneNode(true);
+    regenerateBtn.parentNode.replaceChild(newRegenerateBtn, regenerateBtn);
+    newRegenerateBtn.addEventListener('click', () => researchCompany(research.company_name, research.job_title, true));
 }
 
 function initResearchTabs() {
@@ -850,6 +1289,7 @@ document.addEventListener('DOMContentLoaded', () => {
     initNavigation();
     initResumeUpload();
     initJobSearch();
+    initBatchCoverLetters();
     initSkillAnalysis();
     initCompanyResearch();
     initResearchTabs();
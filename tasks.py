@@ -0,0 +1,162 @@
+import secrets
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from cache import MemoryCache, SQLiteCache
+
+# Task states; the last three are final
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINAL_STATES = (DONE, FAILED, CANCELLED)
+
+class TaskQueueFull(Exception):
+    """Raised when a task is submitted while the queue is at its depth limit."""
+
+# ============================================
+# BACKGROUND TASKS
+# ============================================
+class TaskManager:
+    """Runs slow work on a bounded worker pool and keeps its status in a cache store.
+
+    Task records live in a MemoryCache or SQLiteCache, so with a SQLite store
+    any process sharing the file can read status, results and cancellations.
+    Records expire `result_ttl` seconds after their last update.
+    """
+
+    def __init__(self, store, max_workers: int = 4, max_queue: int = 32, result_ttl: float = 30 * 60,
+                 poll_interval: float = 0.5):
+        self.store = store
+        self.max_queue = max_queue
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task")
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self.submitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    @staticmethod
+    def _key(task_id: str) -> str:
+        return f"task:{task_id}"
+
+    def _save(self, task: Dict[str, Any]) -> None:
+        self.store.set(self._key(task["id"]), task, ttl=self.result_ttl)
+        with self._changed:
+            self._changed.notify_all()
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(self._key(task_id))
+
+    def submit(self, kind: str, func: Callable[[], Any], owner: Optional[str] = None) -> Dict[str, Any]:
+        """Queues `func` and returns its task record; raises TaskQueueFull at the depth limit."""
+        task_id = secrets.token_urlsafe(16)
+        task = {
+            "id": task_id, "kind": kind, "owner": owner, "status": QUEUED,
+            "created": time.time(), "started": None, "finished": None, "result": None, "error": None,
+        }
+        with self._lock:
+            if len(self._futures) >= self.max_queue:
+                self.rejected += 1
+                raise TaskQueueFull(f"{len(self._futures)} tasks already queued or running")
+            self.submitted += 1
+            self._save(task)
+            self._futures[task_id] = self._pool.submit(self._run, task_id, func)
+        return task
+
+    def _run(self, task_id: str, func: Callable[[], Any]) -> None:
+        try:
+            with self._lock:
+                task = self.get(task_id)
+                if task is None or task["status"] != QUEUED:
+                    return  # cancelled (or expired) before a worker picked it up
+                task.update(status=RUNNING, started=time.time())
+                self._save(task)
+
+            try:
+                result, error, status = func(), None, DONE
+            except Exception as e:
+                result, error, status = None, str(e), FAILED
+
+            with self._lock:
+                # A cancellation that arrived while running wins; its result is discarded
+                latest = self.get(task_id)
+                if latest is None or latest["status"] == CANCELLED:
+                    return
+                task.update(status=status, result=result, error=error, finished=time.time())
+                self._save(task)
+                if status == DONE:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+        finally:
+            with self._lock:
+                self._futures.pop(task_id, None)
+
+    def cancel(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Cancels a queued or running task; returns the updated record, or None if unknown.
+
+        Queued work never starts. Running work cannot be interrupted, but its
+        result is discarded when it finishes.
+        """
+        with self._lock:
+            task = self.get(task_id)
+            if task is None or task["status"] in FINAL_STATES:
+                return task
+            future = self._futures.get(task_id)
+            if future is not None and future.cancel():
+                del self._futures[task_id]  # never started, so _run will not clean it up
+            task.update(status=CANCELLED, finished=time.time())
+            self._save(task)
+            self.cancelled += 1
+        return task
+
+    def wait(self, task_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Long-polls a task until it reaches a final state or `timeout` passes; returns the latest record."""
+        deadline = time.monotonic() + timeout
+        task = self.get(task_id)
+        while task is not None and task["status"] not in FINAL_STATES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Local updates wake waiters at once; updates from other processes are seen on the next poll
+            with self._changed:
+                self._changed.wait(min(remaining, self.poll_interval))
+            task = self.get(task_id)
+        return task
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "active": len(self._futures),
+                "max_queue": self.max_queue,
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "completed": self.completed,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "store": self.store.stats(),
+            }
+
+def create_task_manager(config: Dict[str, Any]) -> TaskManager:
+    """Builds the task manager selected by TASK_BACKEND ('memory' or 'sqlite')."""
+    backend = config.get("TASK_BACKEND", "memory")
+    result_ttl = config["TASK_RESULT_TTL"].total_seconds()
+    max_queue = config.get("TASK_MAX_QUEUE", 32)
+
+    if backend == "sqlite":
+        store = SQLiteCache(config.get("TASK_SQLITE_PATH", "tasks.db"), ttl=result_ttl)
+    elif backend == "memory":
+        store = MemoryCache(ttl=result_ttl)
+    else:
+        raise ValueError(f"Unknown TASK_BACKEND: {backend}")
+
+    return TaskManager(store, config.get("TASK_MAX_WORKERS", 4), max_queue, result_ttl)
@@ -0,0 +1,168 @@
+import json
+import os
+import re
+from typing import List, Dict, Any, Optional, Iterator, NamedTuple, Tuple, FrozenSet
+
+# --- Configuration ---
+TAXONOMY_PATH = os.environ.get(
+    "SKILLS_TAXONOMY_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills_taxonomy.json")
+)
+
+# ============================================
+# SKILL MATCHING
+# ============================================
+class SkillMatch(NamedTuple):
+    """A skill occurrence found in a piece of text."""
+    skill: str
+    categories: Tuple[str, ...]
+    start: int
+    end: int
+
+class SkillMatcher:
+    """Finds every skill term in one pass using a single precompiled regex."""
+
+    # Skill terms contain "+", "#", "." and "/" so \b is not a usable boundary;
+    # "&" joins words too ("R&D", "P&L")
+    BOUNDARY_CHARS = r"\w+#&"
+
+    def __init__(self, categories: Dict[str, Tuple[str, ...]], aliases: Dict[str, str], case_sensitive: Dict[str, str]):
+        self.categories = categories
+        # Every searchable term (canonical ids and aliases) -> canonical id
+        self.terms: Dict[str, str] = {term: term for term in categories}
+        self.terms.update(aliases)
+
+        self.case_sensitive = {term: form for term, form in case_sensitive.items() if term in self.terms}
+        self.pattern = re.compile(
+            rf"(?<![{self.BOUNDARY_CHARS}]){self._trie_pattern(self.terms)}(?![{self.BOUNDARY_CHARS}])"
+        )
+
+        # Multi-word terms also imply the shorter terms they contain
+        # ("react native" -> "react", "unit testing" -> "testing")
+        self.implied: Dict[str, Tuple[str, ...]] = {}
+        for term, skill in self.terms.items():
+            words = term.split()
+            ngrams = {" ".join(words[i:j]) for i in range(len(words)) for j in range(i + 1, len(words) + 1)}
+            self.implied[term] = tuple(sorted({
+                self.terms[t] for t in ngrams
+                if t != term and t in self.terms and t not in self.case_sensitive and self.terms[t] != skill
+            }))
+
+    @staticmethod
+    def _trie_pattern(terms) -> str:
+        """Builds a prefix-factored alternation, which the regex engine walks far faster than a flat one."""
+        trie: Dict[str, Any] = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        def build(node: Dict[str, Any]) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            if len(branches) == 1 and "" not in node:
+                return branches[0]
+            return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+        return build(trie)
+
+    def _scan(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        text_lower = text.lower()
+        if len(text_lower) != len(text):
+            # A few non-ASCII characters grow when lowercased; keep offsets aligned
+            text_lower = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+        for m in self.pattern.finditer(text_lower):
+            term = m.group(0)
+            if term in self.case_sensitive and (
+                text[m.start():m.end()] != self.case_sensitive[term]
+                # Short ambiguous terms lead hyphenated phrases ("Go-to-market")
+                or text[m.end():m.end() + 1] == "-"
+            ):
+                continue
+            yield term, m.start(), m.end()
+
+    def finditer(self, text: str) -> Iterator[SkillMatch]:
+        """Yields each skill occurrence with its canonical id, categories and position."""
+        for term, start, end in self._scan(text):
+            skill = self.terms[term]
+            yield SkillMatch(skill, self.categories[skill], start, end)
+
+    def find_skills(self, text: str) -> List[str]:
+        """Returns the distinct canonical skill ids in order of first appearance."""
+        found: Dict[str, None] = {}
+        for term, _, _ in self._scan(text):
+            found[self.terms[term]] = None
+            for skill in self.implied[term]:
+                found[skill] = None
+        return list(found)
+
+# ============================================
+# TAXONOMY INDEX
+# ============================================
+class SkillTaxonomy:
+    """Skill vocabulary, aliases, categories and course mappings, indexed once for O(1) lookups."""
+
+    def __init__(self, categories: Dict[str, List[str]], aliases: Dict[str, str], case_sensitive: Dict[str, str],
+                 gap_skills: List[str], courses: Dict[str, List[Dict[str, str]]]):
+        self.skill_categories = {category: [term.lower() for term in terms] for category, terms in categories.items()}
+
+        categories_by_skill: Dict[str, Tuple[str, ...]] = {}
+        for category, terms in self.skill_categories.items():
+            for term in terms:
+                if category not in categories_by_skill.get(term, ()):
+                    categories_by_skill[term] = categories_by_skill.get(term, ()) + (category,)
+        self.categories_by_skill = categories_by_skill
+
+        self.aliases = {alias.lower(): skill.lower() for alias, skill in aliases.items()}
+        unknown = [skill for skill in self.aliases.values() if skill not in categories_by_skill]
+        if unknown:
+            raise ValueError(f"Aliases point at unknown skills: {unknown}")
+
+        self.gap_skills: FrozenSet[str] = frozenset(self.canonical(skill) or skill.lower() for skill in gap_skills)
+        self.courses = {self.canonical(skill) or skill.lower(): items for skill, items in courses.items()}
+        self.matcher = SkillMatcher(categories_by_skill, self.aliases, case_sensitive)
+
+    @classmethod
+    def load(cls, path: str = TAXONOMY_PATH) -> "SkillTaxonomy":
+        """Loads the taxonomy from its JSON data file."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            data["categories"],
+            data.get("aliases", {}),
+            data.get("case_sensitive", {}),
+            data.get("gap_skills", []),
+            data.get("courses", {})
+        )
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """Maps a skill or alias in any casing ("K8s", "Kubernetes") to its canonical id."""
+        key = skill.strip().lower()
+        if key in self.categories_by_skill:
+            return key
+        return self.aliases.get(key)
+
+    def categories_of(self, skill: str) -> Tuple[str, ...]:
+        """Returns the categories a skill belongs to."""
+        return self.categories_by_skill.get(self.canonical(skill) or "", ())
+
+    def courses_for(self, skill: str) -> Optional[List[Dict[str, str]]]:
+        """Returns the curated courses for a skill, or for the first known skill mentioned in it."""
+        skill_id = self.canonical(skill)
+        if skill_id in self.courses:
+            return self.courses[skill_id]
+
+        # Free-form input such as "Machine Learning Engineer"
+        for skill_id in self.matcher.find_skills(skill):
+            if skill_id in self.courses:
+                return self.courses[skill_id]
+        return None
+
+def format_skill(skill: str) -> str:
+    """Display form used throughout the UI ("machine learning" -> "Machine Learning")."""
+    return skill.title() if not skill.isupper() else skill
+
+TAXONOMY = SkillTaxonomy.load()